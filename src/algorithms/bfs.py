@@ -1,49 +1,231 @@
 from collections import deque
-from utils import log_and_print
+from time import perf_counter
+from utils import log_and_print, tracing_enabled
+from instrumentation import TraversalStats
+from data_structures.csr_network import CSRNetwork
+
+class ShortestPathTree:
+    def __init__(self, start_id, distances, predecessors):
+        self.start_id = start_id
+        self.distances = distances
+        self.predecessors = predecessors
+
+    def __contains__(self, member_id):
+        return member_id in self.distances
+
+    def distance_to(self, member_id):
+        return self.distances.get(member_id, float('inf'))
+
+    def path_to(self, end_id):
+        if end_id not in self.distances:
+            return None
+        return BFS.build_path(self.predecessors, end_id)
 
 class BFS:
     @staticmethod
-    def shortest_path(members, start_id, end_id, file=None):
-        log_and_print(f"Starting BFS to find the shortest path from {start_id} to {end_id}", color='blue', file=file)
-        
-        # Initialization
-        for member in members.values():
-            member.color = 'WHITE'
-            member.distance = float('inf')
-            member.predecessor = None
+    def shortest_path(members, start_id, end_id, file=None, stats=None):
+        trace = tracing_enabled()
+        if trace:
+            log_and_print(f"Starting BFS to find the shortest path from {start_id} to {end_id}", color='blue', file=file)
+        path = BFS._search(members, start_id, end_id, file, stats).path_to(end_id)
+        if path is None:
+            if trace:
+                log_and_print(f"No path found from {start_id} to {end_id}", color='blue', file=file)
+            return None
+        if trace:
+            log_and_print(f"Found path: {path}", color='blue', file=file)
+        return path
+
+    @staticmethod
+    def shortest_paths_from(members, start_id, file=None, stats=None):
+        trace = tracing_enabled()
+        if trace:
+            log_and_print(f"Starting BFS to find the shortest paths from {start_id}", color='blue', file=file)
+        return BFS._search(members, start_id, None, file, stats)
+
+    @staticmethod
+    def all_shortest_paths(members, file=None, stats=None):
+        source_ids = members.member_ids if isinstance(members, CSRNetwork) else list(members)
+        for start_id in source_ids:
+            yield start_id, BFS.shortest_paths_from(members, start_id, file=file, stats=stats)
+
+    @staticmethod
+    def bidirectional_shortest_path(members, start_id, end_id, file=None, stats=None):
+        trace = tracing_enabled()
+        track = stats is not None
+        started = perf_counter() if track else 0.0
+        nodes_visited = edges_relaxed = max_frontier = 0
+        if trace:
+            log_and_print(f"Starting bidirectional BFS to find the shortest path from {start_id} to {end_id}", color='blue', file=file)
+        if isinstance(members, CSRNetwork):
+            graph = members
+            forward = lambda member_id: graph.path_ids(graph.following_of(graph.index[member_id]))
+            backward = lambda member_id: graph.path_ids(graph.followers_of(graph.index[member_id]))
+        else:
+            forward = lambda member_id: [m.member_id for m in members[member_id].following]
+            backward = lambda member_id: [m.member_id for m in members[member_id].followers]
+
+        # forward_tree maps member -> predecessor towards start_id, backward_tree
+        # maps member -> successor towards end_id; depths are tracked per side.
+        forward_tree, backward_tree = {start_id: None}, {end_id: None}
+        forward_depth, backward_depth = {start_id: 0}, {end_id: 0}
+        forward_frontier, backward_frontier = [start_id], [end_id]
+        meeting_id = start_id if start_id == end_id else None
+
+        while meeting_id is None and forward_frontier and backward_frontier:
+            # Grow the smaller frontier by one full level.
+            if len(forward_frontier) <= len(backward_frontier):
+                frontier, neighbors_of = forward_frontier, forward
+                tree, depth, other_depth = forward_tree, forward_depth, backward_depth
+            else:
+                frontier, neighbors_of = backward_frontier, backward
+                tree, depth, other_depth = backward_tree, backward_depth, forward_depth
+
+            next_frontier = []
+            best_length = float('inf')
+            if track:
+                nodes_visited += len(frontier)
+                max_frontier = max(max_frontier, len(forward_frontier) + len(backward_frontier))
+            for current_id in frontier:
+                if trace:
+                    log_and_print(f"Visiting member {current_id}", color='blue', file=file)
+                for neighbor_id in neighbors_of(current_id):
+                    if track:
+                        edges_relaxed += 1
+                    if neighbor_id in depth:
+                        continue
+                    tree[neighbor_id] = current_id
+                    depth[neighbor_id] = depth[current_id] + 1
+                    next_frontier.append(neighbor_id)
+                    if neighbor_id in other_depth and depth[neighbor_id] + other_depth[neighbor_id] < best_length:
+                        best_length = depth[neighbor_id] + other_depth[neighbor_id]
+                        meeting_id = neighbor_id
+
+            if frontier is forward_frontier:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+
+        if track:
+            stats.record(TraversalStats('bfs_bidirectional', nodes_visited, edges_relaxed,
+                                        max_frontier=max_frontier, elapsed=perf_counter() - started))
+        if meeting_id is None:
+            if trace:
+                log_and_print(f"No path found from {start_id} to {end_id}", color='blue', file=file)
+            return None
+
+        path = BFS.build_path(forward_tree, meeting_id)
+        current_id = backward_tree[meeting_id]
+        while current_id is not None:
+            path.append(current_id)
+            current_id = backward_tree[current_id]
+        if trace:
+            log_and_print(f"Found path: {path}", color='blue', file=file)
+        return path
+
+    @staticmethod
+    def build_path(predecessors, end_id):
+        path = []
+        current_id = end_id
+        while current_id is not None:
+            path.append(current_id)
+            current_id = predecessors[current_id]
+        return path[::-1]
 
-        start_member = members[start_id]
-        start_member.color = 'GRAY'
-        start_member.distance = 0
-        start_member.predecessor = None
+    @staticmethod
+    def _search(members, start_id, end_id, file=None, stats=None):
+        # All traversal state lives in per-call dicts, so concurrent searches on
+        # the same network don't interfere and the cost is proportional to the
+        # explored region. The search stops once end_id is dequeued.
+        if isinstance(members, CSRNetwork):
+            return BFS._search_csr(members, start_id, end_id, file, stats)
 
-        queue = deque([start_member])
+        trace = tracing_enabled()
+        track = stats is not None
+        started = perf_counter() if track else 0.0
+        nodes_visited = edges_relaxed = max_frontier = 0
+        distances = {start_id: 0}
+        predecessors = {start_id: None}
+        queue = deque([members[start_id]])
 
         while queue:
+            if track and len(queue) > max_frontier:
+                max_frontier = len(queue)
             current_member = queue.popleft()
-            log_and_print(f"Visiting member {current_member.member_id}, current path: {BFS.build_path(current_member)}", color='blue', file=file)
+            current_id = current_member.member_id
+            if trace:
+                log_and_print(f"Visiting member {current_id}, current path: {BFS.build_path(predecessors, current_id)}", color='blue', file=file)
+            if track:
+                nodes_visited += 1
+            if current_id == end_id:
+                break
+            if track:
+                edges_relaxed += len(current_member.following)
 
             for neighbor in current_member.following:
-                if neighbor.color == 'WHITE':
-                    neighbor.color = 'GRAY'
-                    neighbor.distance = current_member.distance + 1
-                    neighbor.predecessor = current_member
+                if neighbor.member_id not in distances:
+                    distances[neighbor.member_id] = distances[current_id] + 1
+                    predecessors[neighbor.member_id] = current_id
                     queue.append(neighbor)
-                    log_and_print(f"Adding neighbor {neighbor.member_id} to the queue", color='blue', file=file)
+                    if trace:
+                        log_and_print(f"Adding neighbor {neighbor.member_id} to the queue", color='blue', file=file)
 
-            current_member.color = 'BLACK'
+        if track:
+            stats.record(TraversalStats('bfs', nodes_visited, edges_relaxed,
+                                        max_frontier=max_frontier, elapsed=perf_counter() - started))
+        return ShortestPathTree(start_id, distances, predecessors)
 
-        path = BFS.build_path(members[end_id])
-        if members[end_id].distance == float('inf'):
-            log_and_print(f"No path found from {start_id} to {end_id}", color='blue', file=file)
-            return None
-        log_and_print(f"Found path: {path}", color='blue', file=file)
-        return path
+    @staticmethod
+    def _search_csr(graph, start_id, end_id, file=None, stats=None):
+        # Same search over CSR positions: state is indexed by position and
+        # only the explored members are converted back to ids for the tree
+        trace = tracing_enabled()
+        track = stats is not None
+        started = perf_counter() if track else 0.0
+        nodes_visited = edges_relaxed = max_frontier = 0
+        offsets, indices, member_ids = graph.following_offsets, graph.following_indices, graph.member_ids
+        start = graph.index[start_id]
+        end = graph.index.get(end_id, -1) if end_id is not None else -1
+        distance = [-1] * len(graph)
+        predecessor = [-1] * len(graph)
+        distance[start] = 0
+        explored = [start]
+        queue = deque([start])
+
+        while queue:
+            if track and len(queue) > max_frontier:
+                max_frontier = len(queue)
+            current = queue.popleft()
+            if trace:
+                log_and_print(f"Visiting member {member_ids[current]}, current path: {BFS._build_path_csr(graph, predecessor, current)}", color='blue', file=file)
+            if track:
+                nodes_visited += 1
+            if current == end:
+                break
+            if track:
+                edges_relaxed += offsets[current + 1] - offsets[current]
+
+            next_distance = distance[current] + 1
+            for neighbor in indices[offsets[current]:offsets[current + 1]]:
+                if distance[neighbor] < 0:
+                    distance[neighbor] = next_distance
+                    predecessor[neighbor] = current
+                    explored.append(neighbor)
+                    queue.append(neighbor)
+                    if trace:
+                        log_and_print(f"Adding neighbor {member_ids[neighbor]} to the queue", color='blue', file=file)
+
+        if track:
+            stats.record(TraversalStats('bfs', nodes_visited, edges_relaxed,
+                                        max_frontier=max_frontier, elapsed=perf_counter() - started))
+        distances = {member_ids[i]: distance[i] for i in explored}
+        predecessors = {member_ids[i]: member_ids[predecessor[i]] if predecessor[i] >= 0 else None for i in explored}
+        return ShortestPathTree(start_id, distances, predecessors)
 
     @staticmethod
-    def build_path(member):
+    def _build_path_csr(graph, predecessor, index):
         path = []
-        while member is not None:
-            path.append(member.member_id)
-            member = member.predecessor
+        while index != -1:
+            path.append(graph.member_ids[index])
+            index = predecessor[index]
         return path[::-1]
@@ -1,10 +1,144 @@
 import heapq
-from utils import log_and_print
+from operator import itemgetter
+from time import perf_counter
+from utils import log_and_print, tracing_enabled
+from data_structures.csr_network import CSRNetwork
+from instrumentation import TraversalStats
 
 class DFS:
     @staticmethod
-    def highest_engagement_path(members, start_id, end_id, file=None, max_depth=5):
-        log_and_print(f"Starting DFS to find the highest engagement path from {start_id} to {end_id}", color='magenta', file=file)
+    def highest_engagement_path(members, start_id, end_id, file=None, max_depth=5, stats=None):
+        trace = tracing_enabled()
+        if trace:
+            log_and_print(f"Starting DFS to find the highest engagement path from {start_id} to {end_id}", color='magenta', file=file)
+        if isinstance(members, CSRNetwork):
+            graph = members
+            best_path, best_engagement = DFS._bounded_search(
+                graph.index[start_id], graph.index[end_id], max_depth,
+                graph.following_of, graph.followers_of, graph.engagement.__getitem__,
+                graph.path_ids, file, stats)
+        else:
+            best_path, best_engagement = DFS._bounded_search(
+                start_id, end_id, max_depth,
+                lambda member_id: [m.member_id for m in members[member_id].following],
+                lambda member_id: [m.member_id for m in members[member_id].followers],
+                lambda member_id: members[member_id].total_engagement(),
+                list, file, stats)
+
+        if trace:
+            log_and_print(f"Best path: {best_path}, Max engagement: {best_engagement}", color='magenta', file=file)
+        return best_path, best_engagement
+
+    @staticmethod
+    def _bounded_search(start, end, max_depth, following, followers, engagement_of, path_ids, file=None, stats=None):
+        # Branch-and-bound search over simple paths of at most max_depth edges.
+        # gain[k][v] is the best engagement collected after v on any walk that
+        # reaches end within k more edges; since it ignores the simple-path
+        # constraint it is an upper bound used to prune against the best path.
+        trace = tracing_enabled()
+        track = stats is not None
+        started = perf_counter() if track else 0.0
+        engagement = {}
+
+        def engagement_value(node):
+            if node not in engagement:
+                engagement[node] = engagement_of(node)
+            return engagement[node]
+
+        if start == end:
+            value = engagement_value(start)
+            if track:
+                stats.record(TraversalStats('dfs', 1, elapsed=perf_counter() - started))
+            return (path_ids([start]), value) if value > 0 else ([], 0)
+
+        # Members that can reach end within max_depth edges (backward BFS over followers)
+        hops_to_end = {end: 0}
+        frontier = [end]
+        for hops in range(1, max_depth + 1):
+            next_frontier = []
+            for node in frontier:
+                for follower in followers(node):
+                    if follower not in hops_to_end:
+                        hops_to_end[follower] = hops
+                        next_frontier.append(follower)
+            frontier = next_frontier
+        if start not in hops_to_end:
+            if track:
+                stats.record(TraversalStats('dfs', elapsed=perf_counter() - started))
+            return [], 0
+
+        region_following = {
+            node: [u for u in following(node) if u in hops_to_end]
+            for node in hops_to_end if node != end
+        }
+        gain = [{end: 0}]
+        for _ in range(max_depth):
+            previous = gain[-1]
+            current = {end: 0}
+            for node, successors in region_following.items():
+                values = [engagement_value(u) + previous[u] for u in successors if u in previous]
+                if values:
+                    current[node] = max(values)
+            gain.append(current)
+
+        best_path, best_engagement = [], 0
+        path = [start]
+        on_path = {start}
+
+        def expand(node, value):
+            reachable = gain[max_depth - len(path)]
+            options = [(value + engagement_value(u) + reachable[u], u)
+                       for u in region_following[node] if u in reachable and u not in on_path]
+            options.sort(key=itemgetter(0), reverse=True)
+            return iter(options)
+
+        start_engagement = engagement_value(start)
+        if trace:
+            log_and_print(f"Visiting member {path_ids(path)[0]}, current path: {path_ids(path)}, current engagement: {start_engagement}", color='magenta', file=file)
+        stack = [(start_engagement, expand(start, start_engagement))]
+        nodes_visited, edges_relaxed, max_frontier = 1, len(region_following[start]), 1
+
+        while stack:
+            value, options = stack[-1]
+            option = next(options, None)
+            # Options are sorted by bound, so the first one that can't beat the
+            # best path ends this member's subtree.
+            if option is None or option[0] <= best_engagement:
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+
+            bound, neighbor = option
+            if neighbor == end:
+                best_path, best_engagement = path + [end], bound
+                continue
+
+            path.append(neighbor)
+            on_path.add(neighbor)
+            new_value = value + engagement_value(neighbor)
+            if trace:
+                log_and_print(f"Visiting member {path_ids([neighbor])[0]}, current path: {path_ids(path)}, current engagement: {new_value}", color='magenta', file=file)
+            stack.append((new_value, expand(neighbor, new_value)))
+            if track:
+                nodes_visited += 1
+                edges_relaxed += len(region_following[neighbor])
+                max_frontier = max(max_frontier, len(stack))
+
+        if track:
+            stats.record(TraversalStats('dfs', nodes_visited, edges_relaxed, max_frontier=max_frontier,
+                                        elapsed=perf_counter() - started))
+        return path_ids(best_path), best_engagement
+
+    @staticmethod
+    def exhaustive_engagement_path(members, start_id, end_id, file=None, max_depth=5):
+        # Original best-first enumeration of every simple path, kept as a
+        # reference for tests and benchmarks.
+        if isinstance(members, CSRNetwork):
+            return DFS._exhaustive_engagement_path_csr(members, start_id, end_id, file, max_depth)
+
+        trace = tracing_enabled()
+        if trace:
+            log_and_print(f"Starting DFS to find the highest engagement path from {start_id} to {end_id}", color='magenta', file=file)
         best_path, best_engagement = [], 0
         max_heap = [(-members[start_id].total_engagement(), start_id, [start_id])]
 
@@ -13,7 +147,8 @@ class DFS:
             current_member = members[current_id]
             current_engagement = -negative_engagement
 
-            log_and_print(f"Visiting member {current_id}, current path: {path}, current engagement: {current_engagement}", color='magenta', file=file)
+            if trace:
+                log_and_print(f"Visiting member {current_id}, current path: {path}, current engagement: {current_engagement}", color='magenta', file=file)
 
             if current_id == end_id:
                 if current_engagement > best_engagement:
@@ -29,5 +164,42 @@ class DFS:
                     new_engagement = current_engagement + neighbor.total_engagement()
                     heapq.heappush(max_heap, (-new_engagement, neighbor.member_id, new_path))
 
-        log_and_print(f"Best path: {best_path}, Max engagement: {best_engagement}", color='magenta', file=file)
+        if trace:
+            log_and_print(f"Best path: {best_path}, Max engagement: {best_engagement}", color='magenta', file=file)
+        return best_path, best_engagement
+
+    @staticmethod
+    def _exhaustive_engagement_path_csr(graph, start_id, end_id, file=None, max_depth=5):
+        trace = tracing_enabled()
+        if trace:
+            log_and_print(f"Starting DFS to find the highest engagement path from {start_id} to {end_id}", color='magenta', file=file)
+        offsets, indices, engagement = graph.following_offsets, graph.following_indices, graph.engagement
+        start, end = graph.index[start_id], graph.index[end_id]
+        best_path, best_engagement = [], 0
+        max_heap = [(-engagement[start], start, [start])]
+
+        while max_heap:
+            negative_engagement, current, path = heapq.heappop(max_heap)
+            current_engagement = -negative_engagement
+
+            if trace:
+                log_and_print(f"Visiting member {graph.member_ids[current]}, current path: {graph.path_ids(path)}, current engagement: {current_engagement}", color='magenta', file=file)
+
+            if current == end:
+                if current_engagement > best_engagement:
+                    best_path, best_engagement = path, current_engagement
+                continue
+
+            if len(path) > max_depth:
+                continue
+
+            for neighbor in indices[offsets[current]:offsets[current + 1]]:
+                if neighbor not in path:
+                    new_path = path + [neighbor]
+                    new_engagement = current_engagement + engagement[neighbor]
+                    heapq.heappush(max_heap, (-new_engagement, neighbor, new_path))
+
+        best_path = graph.path_ids(best_path)
+        if trace:
+            log_and_print(f"Best path: {best_path}, Max engagement: {best_engagement}", color='magenta', file=file)
         return best_path, best_engagement
@@ -1,43 +1,187 @@
-import heapq
-from utils import log_and_print
+from time import perf_counter
+from utils import log_and_print, tracing_enabled
+from data_structures.csr_network import CSRNetwork
+from data_structures.indexed_heap import IndexedHeap
+from instrumentation import TraversalStats
 
 class Dijkstra:
     @staticmethod
-    def traverse_members(members, start_id, end_id, file=None):
-        log_and_print(f"Starting Dijkstra's algorithm to find shortest path from {start_id} to {end_id}", color='red', file=file)
-        distances = {member_id: float('infinity') for member_id in members}
-        previous_nodes = {member_id: None for member_id in members}
-        distances[start_id] = 0
-        pq = [(0, start_id)]
+    def traverse_members(members, start_id, end_id, file=None, stats=None, weight=None):
+        # weight(from_id, to_id) gives the positive cost of following an edge;
+        # without one every follow costs 1. The search stops as soon as
+        # end_id is settled, which is only correct for positive costs, so a
+        # weight of zero or less raises ValueError.
+        if isinstance(members, CSRNetwork):
+            return Dijkstra._traverse_csr(members, start_id, end_id, file, stats, weight)
 
-        while pq:
-            current_distance, current_member_id = heapq.heappop(pq)
-            log_and_print(f"Visiting member {current_member_id}, current distance: {current_distance}", color='red', file=file)
+        trace = tracing_enabled()
+        track = stats is not None
+        started = perf_counter() if track else 0.0
+        nodes_visited = edges_relaxed = heap_pops = max_frontier = 0
+        heap_pushes = 1  # the start member
+        if trace:
+            log_and_print(f"Starting Dijkstra's algorithm to find shortest path from {start_id} to {end_id}", color='red', file=file)
+        distances = {start_id: 0}
+        previous_nodes = {start_id: None}
+        pq = IndexedHeap()
+        pq.push(start_id, 0)
 
-            if current_distance > distances[current_member_id]:
-                continue
+        while pq:
+            if track:
+                max_frontier = max(max_frontier, len(pq))
+                heap_pops += 1
+            current_member_id, current_distance = pq.pop()
+            if trace:
+                log_and_print(f"Visiting member {current_member_id}, current distance: {current_distance}", color='red', file=file)
 
             current_member = members[current_member_id]
+            if track:
+                nodes_visited += 1
+            if current_member_id == end_id:
+                break
+            if track:
+                edges_relaxed += len(current_member.following)
 
             for neighbor in current_member.following:
                 neighbor_id = neighbor.member_id
-                distance = current_distance + 1
+                if weight is None:
+                    distance = current_distance + 1
+                else:
+                    distance = current_distance + Dijkstra._checked_weight(weight, current_member_id, neighbor_id)
 
-                log_and_print(f"Checking neighbor {neighbor_id} with current distance {distance}", color='red', file=file)
+                if trace:
+                    log_and_print(f"Checking neighbor {neighbor_id} with current distance {distance}", color='red', file=file)
 
-                if distance < distances[neighbor_id]:
-                    log_and_print(f"Updating distance for member {neighbor_id}: old distance {distances[neighbor_id]}, new distance {distance}", color='red', file=file)
+                if distance < distances.get(neighbor_id, float('infinity')):
+                    if trace:
+                        log_and_print(f"Updating distance for member {neighbor_id}: old distance {distances.get(neighbor_id, float('infinity'))}, new distance {distance}", color='red', file=file)
                     distances[neighbor_id] = distance
                     previous_nodes[neighbor_id] = current_member_id
-                    heapq.heappush(pq, (distance, neighbor_id))
+                    pq.push(neighbor_id, distance)
+                    if track:
+                        heap_pushes += 1
+
+        if track:
+            stats.record(TraversalStats('dijkstra', nodes_visited, edges_relaxed, heap_pushes, heap_pops,
+                                        max_frontier, perf_counter() - started))
 
         # Reconstruct the path
         path = []
-        current_id = end_id
-        while current_id is not None:
-            path.append(current_id)
-            current_id = previous_nodes[current_id]
-
-        path.reverse()
-        log_and_print(f"Shortest path using Dijkstra's: {path}", color='red', file=file)
-        return path if path and path[0] == start_id else []
+        if end_id in previous_nodes:
+            current_id = end_id
+            while current_id is not None:
+                path.append(current_id)
+                current_id = previous_nodes[current_id]
+            path.reverse()
+        if trace:
+            log_and_print(f"Shortest path using Dijkstra's: {path}", color='red', file=file)
+        return path
+
+    @staticmethod
+    def _traverse_csr(graph, start_id, end_id, file=None, stats=None, weight=None):
+        trace = tracing_enabled()
+        track = stats is not None
+        started = perf_counter() if track else 0.0
+        nodes_visited = edges_relaxed = heap_pops = max_frontier = 0
+        heap_pushes = 1  # the start member
+        if trace:
+            log_and_print(f"Starting Dijkstra's algorithm to find shortest path from {start_id} to {end_id}", color='red', file=file)
+        offsets, indices, member_ids = graph.following_offsets, graph.following_indices, graph.member_ids
+        start, end = graph.index[start_id], graph.index[end_id]
+        distances = {start: 0}
+        previous_nodes = {start: -1}
+        pq = IndexedHeap()
+        pq.push(start, 0)
+
+        while pq:
+            if track:
+                max_frontier = max(max_frontier, len(pq))
+                heap_pops += 1
+            current, current_distance = pq.pop()
+            if trace:
+                log_and_print(f"Visiting member {member_ids[current]}, current distance: {current_distance}", color='red', file=file)
+            if track:
+                nodes_visited += 1
+            if current == end:
+                break
+            if track:
+                edges_relaxed += offsets[current + 1] - offsets[current]
+
+            for neighbor in indices[offsets[current]:offsets[current + 1]]:
+                if weight is None:
+                    distance = current_distance + 1
+                else:
+                    distance = current_distance + Dijkstra._checked_weight(weight, member_ids[current], member_ids[neighbor])
+
+                if trace:
+                    log_and_print(f"Checking neighbor {member_ids[neighbor]} with current distance {distance}", color='red', file=file)
+
+                if distance < distances.get(neighbor, float('infinity')):
+                    if trace:
+                        log_and_print(f"Updating distance for member {member_ids[neighbor]}: old distance {distances.get(neighbor, float('infinity'))}, new distance {distance}", color='red', file=file)
+                    distances[neighbor] = distance
+                    previous_nodes[neighbor] = current
+                    pq.push(neighbor, distance)
+                    if track:
+                        heap_pushes += 1
+
+        if track:
+            stats.record(TraversalStats('dijkstra', nodes_visited, edges_relaxed, heap_pushes, heap_pops,
+                                        max_frontier, perf_counter() - started))
+
+        # Reconstruct the path
+        path = []
+        if end in previous_nodes:
+            current = end
+            while current != -1:
+                path.append(member_ids[current])
+                current = previous_nodes[current]
+            path.reverse()
+        if trace:
+            log_and_print(f"Shortest path using Dijkstra's: {path}", color='red', file=file)
+        return path
+
+    @staticmethod
+    def _checked_weight(weight, from_id, to_id):
+        cost = weight(from_id, to_id)
+        if not cost > 0:
+            raise ValueError(f"Edge weight from {from_id} to {to_id} must be positive, got {cost}")
+        return cost
+
+    # Edge weights for traverse_members. Both make routes through strong
+    # relationships cheap: cost = 1 / (1 + strength) lies in (0, 1].
+    @staticmethod
+    def inverse_engagement_weight(members):
+        # strength = likes + comments the follower gave the followee
+        if isinstance(members, CSRNetwork):
+            interactions = members.interactions
+            return lambda from_id, to_id: 1 / (1 + interactions.get((from_id, to_id), 0))
+
+        def weight(from_id, to_id):
+            member = members[from_id]
+            return 1 / (1 + member.likes.get(to_id, 0) + member.comments.get(to_id, 0))
+        return weight
+
+    @staticmethod
+    def inverse_influence_weight(members):
+        # strength = the follower's influence on the followee, as in
+        # Member.influence_on (read without inserting into the maps)
+        if isinstance(members, CSRNetwork):
+            graph = members
+            interactions = graph.interactions
+
+            def weight(from_id, to_id):
+                total_engagement = graph.engagement[graph.index[from_id]]
+                if total_engagement == 0:
+                    return 1.0
+                return 1 / (1 + interactions.get((to_id, from_id), 0) / total_engagement * 100)
+            return weight
+
+        def weight(from_id, to_id):
+            member = members[from_id]
+            total_engagement = member.total_engagement()
+            if total_engagement == 0:
+                return 1.0
+            interactions = member.likes_to.get(to_id, 0) + member.comments_to.get(to_id, 0)
+            return 1 / (1 + interactions / total_engagement * 100)
+        return weight
@@ -0,0 +1,83 @@
+import heapq
+from collections import deque
+from itertools import count
+
+class IncrementalBFS:
+    # Keeps a ShortestPathTree from BFS.shortest_paths_from up to date in
+    # place as follow edges change, instead of recomputing it.
+
+    @staticmethod
+    def insert_edge(members, tree, follower_id, followee_id):
+        # A new edge can only shorten distances, so repair is a BFS that
+        # starts at followee_id and only continues through members whose
+        # distance dropped. Returns the number of members updated.
+        distances, predecessors = tree.distances, tree.predecessors
+        if follower_id not in distances:
+            return 0
+        distance = distances[follower_id] + 1
+        if distances.get(followee_id, float('inf')) <= distance:
+            return 0
+
+        distances[followee_id] = distance
+        predecessors[followee_id] = follower_id
+        queue = deque([followee_id])
+        updated = 1
+        while queue:
+            current_id = queue.popleft()
+            distance = distances[current_id] + 1
+            for neighbor in members[current_id].following:
+                neighbor_id = neighbor.member_id
+                if distances.get(neighbor_id, float('inf')) > distance:
+                    distances[neighbor_id] = distance
+                    predecessors[neighbor_id] = current_id
+                    queue.append(neighbor_id)
+                    updated += 1
+        return updated
+
+    @staticmethod
+    def delete_edge(members, tree, follower_id, followee_id):
+        # Call after the edge is removed. Only a tree edge matters, and only
+        # members in followee_id's subtree can get further away: they are
+        # dropped, re-seeded from their closest follower outside the subtree
+        # and settled in distance order, which is Dijkstra with unit weights
+        # restricted to the subtree. Members no longer reachable leave the
+        # tree. Returns the number of members updated.
+        distances, predecessors = tree.distances, tree.predecessors
+        if followee_id == tree.start_id or predecessors.get(followee_id) != follower_id:
+            return 0
+
+        subtree = [followee_id]
+        in_subtree = {followee_id}
+        for current_id in subtree:
+            for neighbor in members[current_id].following:
+                neighbor_id = neighbor.member_id
+                if neighbor_id not in in_subtree and predecessors.get(neighbor_id) == current_id:
+                    in_subtree.add(neighbor_id)
+                    subtree.append(neighbor_id)
+        for member_id in subtree:
+            del distances[member_id], predecessors[member_id]
+
+        # Entries carry a sequence number so member ids are never compared
+        heap = []
+        sequence = count()
+        for member_id in subtree:
+            best = None
+            for follower in members[member_id].followers:
+                distance = distances.get(follower.member_id)
+                if distance is not None and (best is None or distance < best[0]):
+                    best = (distance, follower.member_id)
+            if best is not None:
+                heap.append((best[0] + 1, next(sequence), member_id, best[1]))
+        heapq.heapify(heap)
+
+        while heap:
+            distance, _, member_id, predecessor_id = heapq.heappop(heap)
+            if member_id in distances:
+                continue
+            distances[member_id] = distance
+            predecessors[member_id] = predecessor_id
+            for neighbor in members[member_id].following:
+                neighbor_id = neighbor.member_id
+                if neighbor_id in in_subtree and neighbor_id not in distances:
+                    heapq.heappush(heap, (distance + 1, next(sequence), neighbor_id, member_id))
+        return len(subtree)
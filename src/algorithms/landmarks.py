@@ -0,0 +1,88 @@
+from array import array
+
+INFINITY = float('inf')
+
+class LandmarkOracle:
+    # Approximate hop distances from BFS trees rooted at a few landmark
+    # members. forward[v * k + l] is the distance from landmark l to member v
+    # (over following) and backward[v * k + l] the distance from v to
+    # landmark l (over followers), -1 when there is no path; k is the number
+    # of landmarks. The triangle inequality through every landmark bounds
+    # d(start, end) from both sides without searching.
+    def __init__(self, graph, landmarks, forward, backward):
+        self.graph = graph
+        self.landmarks = landmarks
+        self.forward = forward
+        self.backward = backward
+
+    @classmethod
+    def build(cls, graph, num_landmarks=16):
+        # Landmarks are the members with the most follows in and out, which
+        # lie on many shortest paths
+        size = len(graph)
+        degree = lambda i: (graph.following_offsets[i + 1] - graph.following_offsets[i]
+                            + graph.followers_offsets[i + 1] - graph.followers_offsets[i])
+        landmarks = array('q', sorted(range(size), key=degree, reverse=True)[:num_landmarks])
+        k = len(landmarks)
+
+        forward = array('q', [-1]) * (size * k)
+        backward = array('q', [-1]) * (size * k)
+        for l, landmark in enumerate(landmarks):
+            forward[l::k] = cls._hop_distances(graph.following_offsets, graph.following_indices, size, landmark)
+            backward[l::k] = cls._hop_distances(graph.followers_offsets, graph.followers_indices, size, landmark)
+        return cls(graph, landmarks, forward, backward)
+
+    @staticmethod
+    def _hop_distances(offsets, indices, size, source):
+        distances = array('q', [-1]) * size
+        distances[source] = 0
+        frontier = [source]
+        hops = 0
+        while frontier:
+            hops += 1
+            next_frontier = []
+            for current in frontier:
+                for neighbor in indices[offsets[current]:offsets[current + 1]]:
+                    if distances[neighbor] < 0:
+                        distances[neighbor] = hops
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distances
+
+    def bounds(self, start_id, end_id):
+        # (lower, upper) bounds on the hop distance; both are inf when a
+        # landmark proves there is no path, and upper is inf when no
+        # landmark lies on a route between the two
+        index = self.graph.index
+        s, t = index[start_id], index[end_id]
+        if s == t:
+            return 0, 0
+        k = len(self.landmarks)
+        from_landmark_s, from_landmark_t = self.forward[s * k:s * k + k], self.forward[t * k:t * k + k]
+        to_landmark_s, to_landmark_t = self.backward[s * k:s * k + k], self.backward[t * k:t * k + k]
+
+        lower = 1
+        # d(L, t) <= d(L, s) + d(s, t)
+        for ls, lt in zip(from_landmark_s, from_landmark_t):
+            if ls >= 0:
+                if lt < 0:
+                    return INFINITY, INFINITY
+                if lt - ls > lower:
+                    lower = lt - ls
+        # d(s, L) <= d(s, t) + d(t, L)
+        for sl, tl in zip(to_landmark_s, to_landmark_t):
+            if tl >= 0:
+                if sl < 0:
+                    return INFINITY, INFINITY
+                if sl - tl > lower:
+                    lower = sl - tl
+
+        upper = INFINITY
+        for sl, lt in zip(to_landmark_s, from_landmark_t):
+            if sl >= 0 and lt >= 0 and sl + lt < upper:
+                upper = sl + lt
+        return lower, upper
+
+    def estimate(self, start_id, end_id):
+        # The upper bound is the length of a real path through a landmark
+        return self.bounds(start_id, end_id)[1]
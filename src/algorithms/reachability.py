@@ -0,0 +1,86 @@
+from data_structures.csr_network import CSRNetwork
+
+# int.bit_count is Python 3.10+; older versions count the binary digits
+popcount = getattr(int, 'bit_count', lambda bits: bin(bits).count('1'))
+
+class Reachability:
+    # Bulk reachability over a CSRNetwork (a members dict is frozen first, so
+    # pass a snapshot when making several calls). Visited sets are bitsets:
+    # a bytearray packing one bit per member (member i is bit i & 7 of byte
+    # i >> 3) for single searches, and Python ints with one bit per target
+    # member when many searches run together.
+
+    @staticmethod
+    def k_hop_neighbourhood(members, member_id, k):
+        # Members member_id can reach in at most k follows (excluding itself)
+        reached = Reachability.multi_source_reach(members, [member_id], k)
+        reached.discard(member_id)
+        return reached
+
+    @staticmethod
+    def multi_source_reach(members, seed_ids, max_hops=None):
+        # Members reachable from any of seed_ids (seeds included), in one
+        # level-by-level BFS from all seeds at once
+        graph = Reachability._as_graph(members)
+        offsets, indices = graph.following_offsets, graph.following_indices
+        visited = bytearray((len(graph) + 7) >> 3)
+        frontier = []
+        for member_id in seed_ids:
+            i = graph.index[member_id]
+            if not visited[i >> 3] >> (i & 7) & 1:
+                visited[i >> 3] |= 1 << (i & 7)
+                frontier.append(i)
+        reached = list(frontier)
+
+        hops = 0
+        while frontier and (max_hops is None or hops < max_hops):
+            next_frontier = []
+            for current in frontier:
+                for neighbor in indices[offsets[current]:offsets[current + 1]]:
+                    if not visited[neighbor >> 3] >> (neighbor & 7) & 1:
+                        visited[neighbor >> 3] |= 1 << (neighbor & 7)
+                        next_frontier.append(neighbor)
+            reached.extend(next_frontier)
+            frontier = next_frontier
+            hops += 1
+        return set(graph.path_ids(reached))
+
+    @staticmethod
+    def reach_counts(members, max_hops=None, batch_size=4096):
+        # member_id -> number of other members it can reach (within max_hops).
+        # Targets are processed batch_size at a time: each member carries an
+        # int whose bit t is set once it is known to reach target t, and the
+        # bits spread backwards over followers one hop per round, so a whole
+        # batch costs one pass over the edges per hop.
+        graph = Reachability._as_graph(members)
+        offsets, indices = graph.followers_offsets, graph.followers_indices
+        size = len(graph)
+        counts = [0] * size
+
+        for first in range(0, size, batch_size):
+            reaches = [0] * size
+            frontier = {}
+            for target in range(first, min(first + batch_size, size)):
+                reaches[target] = frontier[target] = 1 << (target - first)
+
+            hops = 0
+            while frontier and (max_hops is None or hops < max_hops):
+                next_frontier = {}
+                for current, bits in frontier.items():
+                    for follower in indices[offsets[current]:offsets[current + 1]]:
+                        new_bits = bits & ~reaches[follower]
+                        if new_bits:
+                            reaches[follower] |= new_bits
+                            next_frontier[follower] = next_frontier.get(follower, 0) | new_bits
+                frontier = next_frontier
+                hops += 1
+
+            for i in range(size):
+                counts[i] += popcount(reaches[i])
+
+        # Every member's own bit was counted once
+        return {member_id: count - 1 for member_id, count in zip(graph.member_ids, counts)}
+
+    @staticmethod
+    def _as_graph(members):
+        return members if isinstance(members, CSRNetwork) else CSRNetwork.from_members(members)
@@ -0,0 +1,137 @@
+from data_structures.csr_network import CSRNetwork
+
+class SCC:
+    @staticmethod
+    def components(members):
+        # Strongly connected components over following, as lists of member ids.
+        # Components come out sinks first (reverse topological order).
+        graph = members if isinstance(members, CSRNetwork) else CSRNetwork.from_members(members)
+        component, count = SCC.tarjan(graph.following_offsets, graph.following_indices, len(graph))
+        groups = [[] for _ in range(count)]
+        for i, c in enumerate(component):
+            groups[c].append(graph.member_ids[i])
+        return groups
+
+    @staticmethod
+    def tarjan(offsets, indices, size):
+        # Iterative Tarjan over CSR arrays. Returns (component, count) where
+        # component[i] numbers member i's component; every edge between
+        # components goes from a higher number to a lower one.
+        index = [-1] * size
+        low = [0] * size
+        on_stack = bytearray(size)
+        stack = []
+        component = [-1] * size
+        counter = count = 0
+
+        for root in range(size):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            # (member, position of the next edge to look at)
+            work = [(root, offsets[root])]
+
+            while work:
+                current, position = work[-1]
+                end = offsets[current + 1]
+                descended = False
+                while position < end:
+                    neighbor = indices[position]
+                    position += 1
+                    if index[neighbor] == -1:
+                        work[-1] = (current, position)
+                        index[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = 1
+                        work.append((neighbor, offsets[neighbor]))
+                        descended = True
+                        break
+                    if on_stack[neighbor] and index[neighbor] < low[current]:
+                        low[current] = index[neighbor]
+                if descended:
+                    continue
+
+                work.pop()
+                if low[current] == index[current]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component[member] = count
+                        if member == current:
+                            break
+                    count += 1
+                if work:
+                    parent = work[-1][0]
+                    if low[current] < low[parent]:
+                        low[parent] = low[current]
+
+        return component, count
+
+class ReachabilityIndex:
+    # Answers "can start reach end?" from the condensation DAG of the
+    # following graph. Components are numbered sinks first, so a component
+    # can only reach lower numbers; that order check rejects many pairs at
+    # once. Up to max_closure_components components, each one also keeps a
+    # bitset of every component it reaches (O(1) queries); larger graphs
+    # fall back to a DAG search that skips components numbered below the
+    # target's.
+    def __init__(self, graph, max_closure_components=50000):
+        self.graph = graph
+        self.component, self.component_count = SCC.tarjan(graph.following_offsets, graph.following_indices, len(graph))
+        self.successors = self._condensation(graph, self.component, self.component_count)
+        self.closure = None
+        if self.component_count <= max_closure_components:
+            self.closure = self._transitive_closure(self.successors)
+
+    @staticmethod
+    def _condensation(graph, component, count):
+        successors = [set() for _ in range(count)]
+        offsets, indices = graph.following_offsets, graph.following_indices
+        for i in range(len(graph)):
+            source = component[i]
+            for j in indices[offsets[i]:offsets[i + 1]]:
+                if component[j] != source:
+                    successors[source].add(component[j])
+        return [sorted(targets, reverse=True) for targets in successors]
+
+    @staticmethod
+    def _transitive_closure(successors):
+        # Successors always have lower numbers, so counting up visits every
+        # component after everything it reaches
+        closure = []
+        for c, targets in enumerate(successors):
+            bits = 1 << c
+            for target in targets:
+                bits |= closure[target]
+            closure.append(bits)
+        return closure
+
+    def component_of(self, member_id):
+        return self.component[self.graph.index[member_id]]
+
+    def reachable(self, start_id, end_id):
+        source, target = self.component_of(start_id), self.component_of(end_id)
+        if source == target:
+            return True
+        if target > source:
+            return False
+        if self.closure is not None:
+            return bool(self.closure[source] >> target & 1)
+
+        visited = {source}
+        stack = [source]
+        while stack:
+            for successor in self.successors[stack.pop()]:
+                if successor == target:
+                    return True
+                # Successors are sorted high to low; the rest can't reach target
+                if successor < target:
+                    break
+                if successor not in visited:
+                    visited.add(successor)
+                    stack.append(successor)
+        return False
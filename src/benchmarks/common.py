@@ -0,0 +1,49 @@
+import random
+from array import array
+from itertools import accumulate
+from data_structures.csr_network import CSRNetwork
+from data_structures.network import Network
+
+def build_network(num_members, out_degree, seed, interactions_per_member=5):
+    rng = random.Random(seed)
+    network = Network()
+    for i in range(1, num_members + 1):
+        network.add_member(i, f'Member{i}')
+    for follower_id in network.members:
+        for followee_id in rng.sample(range(1, num_members + 1), out_degree + 1):
+            if followee_id != follower_id and len(network.members[follower_id].following) < out_degree:
+                network.follow(follower_id, followee_id)
+    for _ in range(num_members * interactions_per_member):
+        liker_id, likee_id = rng.sample(range(1, num_members + 1), 2)
+        network.like(liker_id, likee_id, rng.randint(1, 10))
+        network.comment(liker_id, likee_id, rng.randint(1, 10))
+    return network
+
+def build_graph(num_members, out_degree, seed):
+    # Random CSRNetwork written straight into arrays, for sizes where building
+    # Member objects first would dominate the measurement
+    rng = random.Random(seed)
+    following_offsets = array('q', range(0, num_members * out_degree + 1, out_degree))
+    following_indices = array('q')
+    for i in range(num_members):
+        following_indices.extend(j if j != i else (j + 1) % num_members
+                                 for j in rng.sample(range(num_members), out_degree))
+
+    in_degree = [0] * (num_members + 1)
+    for j in following_indices:
+        in_degree[j + 1] += 1
+    followers_offsets = array('q', accumulate(in_degree))
+    followers_indices = array('q', bytes(8 * len(following_indices)))
+    position = list(followers_offsets[:-1])
+    for i in range(num_members):
+        for j in following_indices[following_offsets[i]:following_offsets[i + 1]]:
+            followers_indices[position[j]] = i
+            position[j] += 1
+
+    likes_counts = array('q', (rng.randint(0, 9) for _ in range(len(following_indices))))
+    engagement = array('q', (sum(likes_counts[following_offsets[i]:following_offsets[i + 1]])
+                             for i in range(num_members)))
+    return CSRNetwork(list(range(1, num_members + 1)), [f'Member{i}' for i in range(1, num_members + 1)],
+                      following_offsets, following_indices, followers_offsets, followers_indices, engagement,
+                      following_offsets, following_indices, likes_counts,
+                      array('q', bytes(8 * (num_members + 1))), array('q'), array('q'))
@@ -0,0 +1,51 @@
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from algorithms.dfs import DFS
+from benchmarks.common import build_network
+
+def time_queries(search, members, pairs, max_depth):
+    results = []
+    start = time.perf_counter()
+    # The algorithms trace every visit to stdout; keep it out of the timings' output.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for start_id, end_id in pairs:
+            results.append(search(members, start_id, end_id, max_depth=max_depth)[1])
+    return time.perf_counter() - start, results
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the exhaustive and bounded DFS engagement search")
+    parser.add_argument('--members', type=int, default=200)
+    parser.add_argument('--degrees', type=int, nargs='+', default=[2, 4, 6, 8, 12])
+    parser.add_argument('--max-depth', type=int, default=5)
+    parser.add_argument('--queries', type=int, default=5)
+    parser.add_argument('--exhaustive-limit', type=int, default=50000,
+                        help="skip the exhaustive search when degree ** max_depth exceeds this")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'degree':>6} {'exhaustive s/query':>20} {'bounded s/query':>17} {'speedup':>9}")
+    for degree in args.degrees:
+        network = build_network(args.members, degree, args.seed)
+        rng = random.Random(args.seed)
+        pairs = [tuple(rng.sample(list(network.members), 2)) for _ in range(args.queries)]
+
+        bounded_time, bounded = time_queries(DFS.highest_engagement_path, network.members, pairs, args.max_depth)
+        if degree ** args.max_depth <= args.exhaustive_limit:
+            exhaustive_time, exhaustive = time_queries(DFS.exhaustive_engagement_path, network.members, pairs, args.max_depth)
+            assert exhaustive == bounded, "bounded search disagrees with exhaustive enumeration"
+            exhaustive_column = f"{exhaustive_time / len(pairs):20.4f}"
+            speedup_column = f"{exhaustive_time / bounded_time:8.1f}x"
+        else:
+            exhaustive_column, speedup_column = f"{'skipped':>20}", f"{'-':>9}"
+        print(f"{degree:6d} {exhaustive_column} {bounded_time / len(pairs):17.4f} {speedup_column}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from benchmarks.common import build_network
+from data_structures.interaction_matrices import InteractionMatrices
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-member and vectorised engagement/influence computation")
+    parser.add_argument('--members', type=int, nargs='+', default=[500, 2000])
+    parser.add_argument('--out-degree', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'members':>8} {'scalar s':>9} {'export s':>9} {'vectorised s':>13}")
+    for num_members in args.members:
+        network = build_network(num_members, args.out_degree, args.seed)
+        members = list(network.members.values())
+
+        start = time.perf_counter()
+        rates = [member.engagement_rate() for member in members]
+        influence = [[member.influence_on(other) for other in members] for member in members]
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matrices = InteractionMatrices.from_members(network.members)
+        export_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vector_rates = matrices.engagement_rates()
+        vector_influence = matrices.influence_matrix()
+        vector_time = time.perf_counter() - start
+
+        assert np.allclose(vector_rates, rates)
+        assert np.allclose(vector_influence.toarray(), influence)
+        print(f"{num_members:8d} {scalar_time:9.3f} {export_time:9.3f} {vector_time:13.4f}")
+
+if __name__ == "__main__":
+    main()
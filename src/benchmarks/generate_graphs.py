@@ -0,0 +1,38 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import graph_generators
+from data_structures.graph_file import save_graph
+
+MODELS = {
+    'erdos_renyi': graph_generators.erdos_renyi,
+    'power_law': graph_generators.power_law,
+    'community': graph_generators.community,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the synthetic graph generators")
+    parser.add_argument('--members', type=int, default=1000000)
+    parser.add_argument('--out-degree', type=float, default=10)
+    parser.add_argument('--models', nargs='+', choices=sorted(MODELS), default=sorted(MODELS))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--save', help="write each graph to this path ({model} is replaced by the model name)")
+    args = parser.parse_args()
+
+    print(f"{'model':>12} {'edges':>10} {'likes':>10} {'max in-degree':>14} {'seconds':>8}")
+    for model in args.models:
+        start = time.perf_counter()
+        graph = MODELS[model](args.members, args.out_degree, seed=args.seed)
+        elapsed = time.perf_counter() - start
+        max_in_degree = max(graph.in_degree(i) for i in range(len(graph)))
+        print(f"{model:>12} {graph.edge_count:10d} {len(graph.likes_indices):10d} {max_in_degree:14d} {elapsed:8.2f}")
+        if args.save:
+            save_graph(graph, args.save.format(model=model))
+        del graph
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from algorithms.bfs import BFS
+from benchmarks.common import build_graph
+from data_structures.graph_file import load_graph, save_graph
+from utils import set_tracing
+
+def main():
+    parser = argparse.ArgumentParser(description="Time saving and memory-mapped loading of a graph file")
+    parser.add_argument('--members', type=int, default=200000)
+    parser.add_argument('--out-degree', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    set_tracing(False)
+    start = time.perf_counter()
+    graph = build_graph(args.members, args.out_degree, args.seed)
+    build_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'network.graph')
+        start = time.perf_counter()
+        save_graph(graph, path)
+        save_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded = load_graph(path)
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tree = BFS.shortest_paths_from(loaded, loaded.member_ids[0])
+        bfs_time = time.perf_counter() - start
+
+        print(f"{args.members} members, {graph.edge_count} follow edges, file {os.path.getsize(path) / 2**20:.1f} MiB")
+        print(f"build (in memory): {build_time:8.3f} s")
+        print(f"save:              {save_time:8.3f} s")
+        print(f"load (mmap):       {load_time * 1000:8.3f} ms")
+        print(f"first BFS:         {bfs_time:8.3f} s  ({len(tree.distances)} members reached, includes building the id index)")
+        del tree, loaded
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import graph_generators
+from algorithms.bfs import BFS
+from data_structures.network import Network
+from query_service import PathQueryService
+from utils import set_tracing
+
+def random_follows(network, num_follows, seed):
+    rng = random.Random(seed)
+    member_ids = list(network.members)
+    return [tuple(rng.sample(member_ids, 2)) for _ in range(num_follows)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep cached BFS trees fresh under a stream of follows and unfollows: incremental updates vs full recompute")
+    parser.add_argument('--members', type=int, default=5000)
+    parser.add_argument('--degree', type=int, default=8)
+    parser.add_argument('--sources', type=int, default=10, help="cached BFS trees")
+    parser.add_argument('--follows', type=int, default=200, help="follows added, then removed again")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    set_tracing(False)
+
+    graph = graph_generators.erdos_renyi(args.members, args.degree, seed=args.seed)
+    source_ids = graph.member_ids[:args.sources]
+
+    # Full recompute: rebuild every cached tree after each follow, then
+    # after each unfollow of the same edges
+    network = Network.from_graph(graph)
+    follows = random_follows(network, args.follows, args.seed)
+    unfollows = follows[::-1]
+    recompute = {}
+    for phase, mutate, edges in (('follow', network.follow, follows), ('unfollow', network.unfollow, unfollows)):
+        start = time.perf_counter()
+        for follower_id, followee_id in edges:
+            mutate(follower_id, followee_id)
+            trees = [BFS.shortest_paths_from(network.members, source_id) for source_id in source_ids]
+        recompute[phase] = (time.perf_counter() - start, trees)
+
+    # Incremental: the query service repairs its cached trees in place
+    network = Network.from_graph(graph)
+    service = PathQueryService(network)
+    for source_id in source_ids:
+        service.shortest_paths_from(source_id)
+    print(f"{'strategy':>21} {'seconds':>9} {'ms/change':>10}")
+    for phase, mutate, edges in (('follow', network.follow, follows), ('unfollow', network.unfollow, unfollows)):
+        start = time.perf_counter()
+        for follower_id, followee_id in edges:
+            mutate(follower_id, followee_id)
+        incremental = time.perf_counter() - start
+
+        elapsed, trees = recompute[phase]
+        for source_id, tree in zip(source_ids, trees):
+            assert service.shortest_paths_from(source_id).distances == tree.distances
+        print(f"{phase + ', recompute':>21} {elapsed:9.3f} {elapsed / len(edges) * 1000:10.3f}")
+        print(f"{phase + ', incremental':>21} {incremental:9.3f} {incremental / len(edges) * 1000:10.3f}")
+    print(f"Tree updates: {service.cache_info()['trees']['updates']}")
+
+if __name__ == "__main__":
+    main()
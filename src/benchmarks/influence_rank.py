@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from scipy import sparse
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import graph_generators
+from algorithms.pagerank import PageRank
+from data_structures.interaction_matrices import InteractionMatrices
+
+def main():
+    parser = argparse.ArgumentParser(description="Weighted PageRank timing: cold start, warm start after changes, personalised")
+    parser.add_argument('--members', type=int, default=150000)
+    parser.add_argument('--degree', type=int, default=8, help="follows drawn per member; repeated and self follows are dropped, so the defaults give about 1M follows")
+    parser.add_argument('--new-follows', type=int, default=10000, help="follows added before the warm-started run")
+    parser.add_argument('--tol', type=float, default=1e-8)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph = graph_generators.power_law(args.members, args.degree, seed=args.seed)
+    matrices = InteractionMatrices.from_graph(graph)
+    print(f"{len(graph)} members, {graph.edge_count} follows; generated and exported in {time.perf_counter() - start:.2f}s")
+
+    def timed(label, matrices, **options):
+        start = time.perf_counter()
+        transition = PageRank.transition(matrices)
+        prepared = time.perf_counter() - start
+        result = PageRank.influence_scores(matrices, tol=args.tol, transition=transition, **options)
+        elapsed = time.perf_counter() - start
+        print(f"{label:>24} {prepared:8.3f}s {elapsed - prepared:8.3f}s {result.iterations:6d} {str(result.converged):>9}")
+        return result
+
+    print(f"{'run':>24} {'matrix':>9} {'iterate':>9} {'iters':>6} {'converged':>9}")
+    cold = timed('cold start', matrices)
+
+    # Simulate churn: extra follow edges between random members
+    rng = np.random.default_rng(args.seed)
+    n = len(graph)
+    extra = sparse.csr_matrix((np.ones(args.new_follows, dtype=np.int64),
+                               (rng.integers(0, n, args.new_follows), rng.integers(0, n, args.new_follows))), shape=(n, n))
+    changed = InteractionMatrices(matrices.member_ids, matrices.likes, matrices.comments, matrices.followers_count,
+                                  matrices.following_count, ((matrices.following + extra) > 0).astype(np.int64))
+    timed('after changes, cold', changed)
+    timed('after changes, warm', changed, warm_start=cold)
+    timed('personalised (10 seeds)', matrices, seeds=[member_id for member_id, _ in cold.top(10)])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.event_log import read_events, write_events
+from data_structures.network import Network
+
+def random_events(num_events, num_members, seed):
+    rng = random.Random(seed)
+    for _ in range(num_events):
+        source_id, target_id = rng.sample(range(1, num_members + 1), 2)
+        event = rng.choice(('follow', 'like', 'like', 'comment'))
+        yield event, source_id, target_id, 1 if event == 'follow' else rng.randint(1, 10)
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure event-log ingestion throughput")
+    parser.add_argument('--events', type=int, default=500000)
+    parser.add_argument('--members', type=int, default=50000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'source':>22} {'seconds':>8} {'events/s':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for fmt in ('csv', 'jsonl'):
+            path = os.path.join(directory, f'events.{fmt}')
+            write_events(random_events(args.events, args.members, args.seed), path)
+
+            start = time.perf_counter()
+            network = Network()
+            applied = network.ingest(read_events(path))
+            elapsed = time.perf_counter() - start
+            print(f"{fmt + ' file, ingest':>22} {elapsed:8.2f} {applied / elapsed:10.0f}")
+
+    events = list(random_events(args.events, args.members, args.seed))
+    start = time.perf_counter()
+    Network().ingest(events)
+    elapsed = time.perf_counter() - start
+    print(f"{'in memory, ingest':>22} {elapsed:8.2f} {len(events) / elapsed:10.0f}")
+
+if __name__ == "__main__":
+    main()
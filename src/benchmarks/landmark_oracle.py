@@ -0,0 +1,66 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import graph_generators
+from algorithms.bfs import BFS
+from algorithms.landmarks import LandmarkOracle
+from data_structures.graph_file import load_graph, save_landmarks
+from utils import set_tracing
+
+def main():
+    parser = argparse.ArgumentParser(description="Landmark distance oracle: accuracy and latency against exact BFS")
+    parser.add_argument('--graph', help="graph file from main.py --save-graph (default: generate a power-law graph)")
+    parser.add_argument('--members', type=int, default=100000)
+    parser.add_argument('--degree', type=int, default=8)
+    parser.add_argument('--landmarks', type=int, nargs='+', default=[4, 16, 32])
+    parser.add_argument('--pairs', type=int, default=200)
+    parser.add_argument('--save', help="write the oracle for the last --landmarks value to this file")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    set_tracing(False)
+
+    graph = load_graph(args.graph) if args.graph else graph_generators.power_law(args.members, args.degree, seed=args.seed)
+    rng = random.Random(args.seed)
+    pairs = [tuple(rng.sample(list(graph.member_ids), 2)) for _ in range(args.pairs)]
+
+    start = time.perf_counter()
+    exact = []
+    for start_id, end_id in pairs:
+        path = BFS.shortest_path(graph, start_id, end_id)
+        exact.append(len(path) - 1 if path else float('inf'))
+    bfs_time = (time.perf_counter() - start) / len(pairs)
+    reachable = [distance != float('inf') for distance in exact]
+    print(f"{len(graph)} members, {graph.edge_count} follows; exact BFS: {bfs_time * 1e6:.0f} us/query, "
+          f"{sum(reachable)}/{len(pairs)} pairs reachable")
+
+    print(f"{'landmarks':>9} {'build s':>8} {'us/query':>9} {'exact':>7} {'mean error':>11} {'within 1':>9} {'no path proven':>14}")
+    for num_landmarks in args.landmarks:
+        start = time.perf_counter()
+        oracle = LandmarkOracle.build(graph, num_landmarks)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bounds = [oracle.bounds(start_id, end_id) for start_id, end_id in pairs]
+        query_time = (time.perf_counter() - start) / len(pairs)
+
+        estimates = [upper for _, upper in bounds]
+        reachable_pairs = [(estimate, distance) for estimate, distance in zip(estimates, exact) if distance != float('inf')]
+        exact_hits = sum(estimate == distance for estimate, distance in reachable_pairs)
+        errors = [estimate - distance for estimate, distance in reachable_pairs if estimate != float('inf')]
+        unreachable_detected = sum(lower == float('inf') for (lower, _), ok in zip(bounds, reachable) if not ok)
+        print(f"{num_landmarks:9d} {build_time:8.2f} {query_time * 1e6:9.1f} "
+              f"{exact_hits / max(len(reachable_pairs), 1):7.1%} {sum(errors) / max(len(errors), 1):11.2f} "
+              f"{sum(error <= 1 for error in errors) / max(len(reachable_pairs), 1):9.1%} "
+              f"{unreachable_detected:6d}/{len(pairs) - sum(reachable):<7d}")
+
+    if args.save:
+        save_landmarks(oracle, args.save)
+        print(f"Saved {len(oracle.landmarks)} landmarks to {args.save}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.network import Network
+
+def traced_bytes(build):
+    # Bytes still allocated after build() returns, and its wall time
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory used per member, per follow edge and per interaction")
+    parser.add_argument('--members', type=int, default=1000000)
+    parser.add_argument('--follows', type=int, default=2000000)
+    parser.add_argument('--interactions', type=int, default=1000000)
+    parser.add_argument('--influence-reads', type=int, default=1000000,
+                        help="influence_on calls between random pairs after building")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    follows = [(rng.randint(1, args.members), rng.randint(1, args.members)) for _ in range(args.follows)]
+    interactions = [(rng.randint(1, args.members), rng.randint(1, args.members)) for _ in range(args.interactions)]
+    reads = [(rng.randint(1, args.members), rng.randint(1, args.members)) for _ in range(args.influence_reads)]
+
+    def add_members():
+        network = Network()
+        for i in range(1, args.members + 1):
+            network.add_member(i, f'Member{i}')
+        return network
+    network, member_bytes, member_time = traced_bytes(add_members)
+
+    def add_follows():
+        for follower_id, followee_id in follows:
+            network.follow(follower_id, followee_id)
+    _, follow_bytes, follow_time = traced_bytes(add_follows)
+
+    def add_interactions():
+        for liker_id, likee_id in interactions:
+            network.like(liker_id, likee_id, 1)
+    _, interaction_bytes, interaction_time = traced_bytes(add_interactions)
+
+    members = network.members
+    def read_influence():
+        for member_id, other_id in reads:
+            members[member_id].influence_on(members[other_id])
+    _, read_bytes, read_time = traced_bytes(read_influence)
+
+    print(f"{'step':>14} {'count':>9} {'MiB':>9} {'bytes each':>11} {'seconds':>8}")
+    for step, count, allocated, elapsed in (('members', args.members, member_bytes, member_time),
+                                            ('follows', args.follows, follow_bytes, follow_time),
+                                            ('likes', args.interactions, interaction_bytes, interaction_time),
+                                            ('influence_on', args.influence_reads, read_bytes, read_time)):
+        print(f"{step:>14} {count:9d} {allocated / 2**20:9.1f} {allocated / max(count, 1):11.1f} {elapsed:8.2f}")
+    total = member_bytes + follow_bytes + interaction_bytes + read_bytes
+    print(f"{'total':>14} {'':>9} {total / 2**20:9.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.common import build_network
+from report import member_paths, parallel_member_paths
+from utils import set_tracing
+
+def main():
+    parser = argparse.ArgumentParser(description="Scale the per-source path analysis across processes")
+    parser.add_argument('--members', type=int, default=200)
+    parser.add_argument('--out-degree', type=int, default=5)
+    parser.add_argument('--sources', type=int, default=32)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    set_tracing(False)
+    graph = build_network(args.members, args.out_degree, args.seed).freeze()
+    source_ids = graph.member_ids[:args.sources]
+
+    start = time.perf_counter()
+    expected = [member_paths(graph, member_id) for member_id in source_ids]
+    serial_time = time.perf_counter() - start
+    print(f"{'workers':>7} {'seconds':>8} {'speedup':>8}")
+    print(f"{'serial':>7} {serial_time:8.2f} {1.0:7.1f}x")
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        sections = list(parallel_member_paths(graph, source_ids, workers=workers))
+        elapsed = time.perf_counter() - start
+        assert sections == expected, "parallel report differs from the serial one"
+        print(f"{workers:7d} {elapsed:8.2f} {serial_time / elapsed:7.1f}x")
+
+if __name__ == "__main__":
+    main()
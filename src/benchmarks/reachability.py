@@ -0,0 +1,56 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import graph_generators
+from algorithms.bfs import BFS
+from algorithms.reachability import Reachability
+from utils import set_tracing
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk reachability: bitset passes vs one BFS per member / per pair")
+    parser.add_argument('--members', type=int, nargs='+', default=[1000, 5000, 20000])
+    parser.add_argument('--degree', type=int, default=3)
+    parser.add_argument('--seeds', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    set_tracing(False)
+
+    print(f"{'members':>8} {'reach counts':>13} {'BFS per member':>15} {'seed reach':>11} {'BFS per pair*':>14}")
+    for num_members in args.members:
+        graph = graph_generators.erdos_renyi(num_members, args.degree, seed=args.seed)
+        member_ids = graph.member_ids
+
+        start = time.perf_counter()
+        counts = Reachability.reach_counts(graph)
+        bitset = time.perf_counter() - start
+
+        # One BFS tree per member; timed on a sample and scaled up
+        sample = member_ids[:200]
+        start = time.perf_counter()
+        for member_id in sample:
+            assert len(BFS.shortest_paths_from(graph, member_id).distances) - 1 == counts[member_id]
+        per_member = (time.perf_counter() - start) * num_members / len(sample)
+
+        seeds = random.Random(args.seed).sample(list(member_ids), args.seeds)
+        start = time.perf_counter()
+        reached = Reachability.multi_source_reach(graph, seeds)
+        multi_source = time.perf_counter() - start
+
+        # Seed x target shortest_path calls; timed on a sample of targets
+        targets = member_ids[:20]
+        start = time.perf_counter()
+        for target_id in targets:
+            any(BFS.shortest_path(graph, seed_id, target_id) is not None for seed_id in seeds)
+        per_pair = (time.perf_counter() - start) * num_members / len(targets)
+
+        print(f"{num_members:8d} {bitset:12.2f}s {per_member:14.2f}s {multi_source:10.4f}s {per_pair:13.2f}s"
+              f"   ({len(reached)} reached)")
+    print("* extrapolated from a sample")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.common import build_network
+from report import REPORT_BUFFER_SIZE, network_sections, write_report
+from utils import set_tracing
+
+def time_report(network, path, source_ids, trace, buffer_size):
+    set_tracing(trace)
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        write_report(path, network_sections(network, len(network.members), source_ids=source_ids), buffer_size)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the analysis report with and without traversal tracing")
+    parser.add_argument('--members', type=int, default=1000)
+    parser.add_argument('--out-degree', type=int, default=5)
+    parser.add_argument('--sources', type=int, default=2,
+                        help="number of source members to report on (each covers every target)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    network = build_network(args.members, args.out_degree, args.seed)
+    source_ids = list(network.members)[:args.sources]
+
+    with tempfile.TemporaryDirectory() as directory:
+        traced_path = os.path.join(directory, 'traced.txt')
+        quiet_path = os.path.join(directory, 'quiet.txt')
+        # Tracing on with a default-sized buffer is how main() used to run
+        traced_time = time_report(network, traced_path, source_ids, True, -1)
+        quiet_time = time_report(network, quiet_path, source_ids, False, REPORT_BUFFER_SIZE)
+        with open(traced_path) as traced, open(quiet_path) as quiet:
+            assert traced.read() == quiet.read(), "quiet mode changed the report"
+        report_size = os.path.getsize(quiet_path)
+    set_tracing(True)
+
+    print(f"{args.members} members, {len(source_ids)} sources, report {report_size / 1024:.0f} KiB")
+    print(f"traced:   {traced_time:8.2f} s")
+    print(f"quiet:    {quiet_time:8.2f} s")
+    print(f"speedup:  {traced_time / quiet_time:8.1f}x")
+
+if __name__ == "__main__":
+    main()
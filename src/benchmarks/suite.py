@@ -0,0 +1,163 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import graph_generators
+from algorithms.bfs import BFS
+from algorithms.dfs import DFS
+from algorithms.dijkstra import Dijkstra
+from data_structures.network import Network
+from instrumentation import StatsCollector
+from utils import set_tracing
+
+# Each case takes (network, graph, pairs, stats); the path cases record their
+# traversal counters into stats. `graph` is the frozen snapshot for the csr
+# backend and network.members otherwise.
+
+def bfs_case(network, graph, pairs, stats):
+    for start_id, end_id in pairs:
+        BFS.shortest_path(graph, start_id, end_id, stats=stats)
+
+def dfs_case(network, graph, pairs, stats):
+    for start_id, end_id in pairs:
+        DFS.highest_engagement_path(graph, start_id, end_id, stats=stats)
+
+def dijkstra_case(network, graph, pairs, stats):
+    for start_id, end_id in pairs:
+        Dijkstra.traverse_members(graph, start_id, end_id, stats=stats)
+
+def engagement_rate_case(network, graph, pairs, stats):
+    for member in network.members.values():
+        member.engagement_rate()
+
+def influence_case(network, graph, pairs, stats):
+    for member in network.members.values():
+        for followee in member.following:
+            member.influence_on(followee)
+
+def influence_matrix_case(network, graph, pairs, stats):
+    matrices = network.to_interaction_matrices()
+    matrices.engagement_rates()
+    matrices.influence_matrix()
+
+CASES = {
+    'bfs': bfs_case,
+    'dfs': dfs_case,
+    'dijkstra': dijkstra_case,
+    'engagement_rate': engagement_rate_case,
+    'influence': influence_case,
+    'influence_matrix': influence_matrix_case,
+}
+PATH_CASES = ('bfs', 'dfs', 'dijkstra')
+
+def run_case(case, network, graph, pairs):
+    # Wall time is measured without instrumentation; the traversal counters
+    # and peak memory come from a second run, since tracemalloc slows
+    # everything down.
+    start = time.perf_counter()
+    CASES[case](network, graph, pairs, None)
+    seconds = time.perf_counter() - start
+
+    stats = StatsCollector()
+    tracemalloc.start()
+    CASES[case](network, graph, pairs, stats)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    counters = {}
+    for fields in stats.summary().values():
+        counters = {field: fields[field]['total'] for field in ('nodes_visited', 'edges_relaxed', 'heap_pushes', 'heap_pops')}
+        counters['max_frontier'] = fields['max_frontier']['max']
+    return seconds, peak_bytes, counters
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(__file__), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(sizes, out_degrees, cases, backends, queries, seed):
+    results = []
+    for num_members in sizes:
+        for out_degree in out_degrees:
+            network = Network.from_graph(graph_generators.erdos_renyi(num_members, out_degree, seed=seed))
+            rng = random.Random(seed)
+            member_ids = list(network.members)
+            pairs = [tuple(rng.sample(member_ids, 2)) for _ in range(queries)]
+            edges = sum(len(member.following) for member in network.members.values())
+
+            for backend in backends:
+                graph = network.freeze() if backend == 'csr' else network.members
+                for case in cases:
+                    if backend == 'csr' and case not in PATH_CASES:
+                        continue
+                    seconds, peak_bytes, counters = run_case(case, network, graph, pairs)
+                    nodes_expanded = counters.get('nodes_visited')
+                    operations = len(pairs) if case in PATH_CASES else num_members
+                    result = {
+                        'case': case, 'backend': backend, 'members': num_members, 'out_degree': out_degree,
+                        'edges': edges, 'operations': operations, 'seconds': seconds,
+                        'seconds_per_operation': seconds / operations, 'peak_bytes': peak_bytes,
+                        'nodes_expanded': nodes_expanded, 'counters': counters,
+                    }
+                    results.append(result)
+                    print(f"{case:>16} {backend:>7} {num_members:8d} {out_degree:4d} {seconds:9.4f}s "
+                          f"{peak_bytes / 1024:10.1f} KiB {nodes_expanded if nodes_expanded is not None else '-':>10}")
+    return results
+
+def compare(old_path, new_path):
+    # Prints the time and memory ratio new/old for every result present in both files
+    def load(path):
+        with open(path) as f:
+            data = json.load(f)
+        return data, {(r['case'], r['backend'], r['members'], r['out_degree']): r for r in data['results']}
+
+    old_data, old = load(old_path)
+    new_data, new = load(new_path)
+    print(f"old: {old_data.get('revision')}  new: {new_data.get('revision')}")
+    print(f"{'case':>16} {'backend':>7} {'members':>8} {'deg':>4} {'time new/old':>13} {'memory new/old':>15}")
+    for key in sorted(old.keys() & new.keys(), key=str):
+        time_ratio = new[key]['seconds'] / old[key]['seconds'] if old[key]['seconds'] else float('nan')
+        memory_ratio = new[key]['peak_bytes'] / old[key]['peak_bytes'] if old[key]['peak_bytes'] else float('nan')
+        print(f"{key[0]:>16} {key[1]:>7} {key[2]:8d} {key[3]:4d} {time_ratio:13.2f} {memory_ratio:15.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the algorithms and metrics over a grid of network sizes and densities")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 2000])
+    parser.add_argument('--out-degrees', type=int, nargs='+', default=[2, 5, 10])
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--backends', nargs='+', choices=['members', 'csr'], default=['members', 'csr'])
+    parser.add_argument('--queries', type=int, default=20, help="random (start, end) pairs per path case")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help="compare two result files and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    set_tracing(False)
+    results = run_suite(args.sizes, args.out_degrees, args.cases, args.backends, args.queries, args.seed)
+    with open(args.output, 'w') as f:
+        json.dump({
+            'revision': git_revision(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'results': results,
+        }, f, indent=2)
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
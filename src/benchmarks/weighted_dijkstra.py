@@ -0,0 +1,69 @@
+import argparse
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import graph_generators
+from algorithms.dijkstra import Dijkstra
+from data_structures.network import Network
+from instrumentation import StatsCollector
+from utils import set_tracing
+
+def lazy_heap_distances(members, start_id, weight):
+    # Reference: heapq with duplicate entries skipped when stale, searching
+    # the whole reachable graph. Returns (distances, entries pushed).
+    distances = {start_id: 0}
+    pq = [(0, start_id)]
+    pushes = 1
+    while pq:
+        current_distance, current_id = heapq.heappop(pq)
+        if current_distance > distances[current_id]:
+            continue
+        for neighbor in members[current_id].following:
+            distance = current_distance + weight(current_id, neighbor.member_id)
+            if distance < distances.get(neighbor.member_id, float('infinity')):
+                distances[neighbor.member_id] = distance
+                heapq.heappush(pq, (distance, neighbor.member_id))
+                pushes += 1
+    return distances, pushes
+
+def main():
+    parser = argparse.ArgumentParser(description="Weighted Dijkstra: indexed heap with early exit vs lazy heapq over the whole graph")
+    parser.add_argument('--members', type=int, default=20000)
+    parser.add_argument('--degrees', type=int, nargs='+', default=[5, 20, 50])
+    parser.add_argument('--queries', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    set_tracing(False)
+
+    print(f"{'degree':>6} {'lazy s/query':>13} {'lazy pushes':>12} {'indexed s/query':>16} {'indexed updates':>15}")
+    for degree in args.degrees:
+        network = Network.from_graph(graph_generators.erdos_renyi(args.members, degree, seed=args.seed,
+                                                                  like_probability=0.6, comment_probability=0.3))
+        members = network.members
+        weight = Dijkstra.inverse_engagement_weight(members)
+        rng = random.Random(args.seed)
+        pairs = [tuple(rng.sample(list(members), 2)) for _ in range(args.queries)]
+
+        start = time.perf_counter()
+        lazy_pushes = 0
+        for start_id, end_id in pairs:
+            lazy_pushes += lazy_heap_distances(members, start_id, weight)[1]
+        lazy = time.perf_counter() - start
+
+        stats = StatsCollector()
+        start = time.perf_counter()
+        for start_id, end_id in pairs:
+            Dijkstra.traverse_members(members, start_id, end_id, weight=weight, stats=stats)
+        indexed = time.perf_counter() - start
+        indexed_pushes = stats.summary()['dijkstra']['heap_pushes']['total']
+
+        print(f"{degree:6d} {lazy / args.queries:13.4f} {lazy_pushes / args.queries:12.0f} "
+              f"{indexed / args.queries:16.4f} {indexed_pushes / args.queries:15.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+from array import array
+from functools import cached_property
+
+class CSRNetwork:
+    # Read-only snapshot of a Network. Members are renumbered to dense indices
+    # 0..n-1 and the follow graph is stored in both directions as offsets +
+    # neighbor-index arrays; engagement[i] caches Member.total_engagement().
+    # Likes and comments given are stored the same way (in the order of the
+    # member's dicts), with a parallel counts array. Any indexable sequence
+    # works as storage (arrays built here, or memoryviews over a
+    # memory-mapped graph file).
+
+    def __init__(self, member_ids, names, following_offsets, following_indices,
+                 followers_offsets, followers_indices, engagement,
+                 likes_offsets=None, likes_indices=None, likes_counts=None,
+                 comments_offsets=None, comments_indices=None, comments_counts=None):
+        self.member_ids = member_ids
+        self.names = names
+        self.following_offsets = following_offsets
+        self.following_indices = following_indices
+        self.followers_offsets = followers_offsets
+        self.followers_indices = followers_indices
+        self.engagement = engagement
+        self.likes_offsets = likes_offsets
+        self.likes_indices = likes_indices
+        self.likes_counts = likes_counts
+        self.comments_offsets = comments_offsets
+        self.comments_indices = comments_indices
+        self.comments_counts = comments_counts
+        # Set when the arrays are views over a graph file, see graph_file.load_graph
+        self.source_path = None
+
+    @classmethod
+    def from_members(cls, members):
+        member_ids = list(members)
+        index = {member_id: i for i, member_id in enumerate(member_ids)}
+
+        following_offsets, following_indices = array('q', [0]), array('q')
+        followers_offsets, followers_indices = array('q', [0]), array('q')
+        likes_offsets, likes_indices, likes_counts = array('q', [0]), array('q'), array('q')
+        comments_offsets, comments_indices, comments_counts = array('q', [0]), array('q'), array('q')
+        engagement = array('q')
+        names = []
+
+        for member_id in member_ids:
+            member = members[member_id]
+            names.append(member.name)
+            following_indices.extend(sorted(index[m.member_id] for m in member.following))
+            following_offsets.append(len(following_indices))
+            followers_indices.extend(sorted(index[m.member_id] for m in member.followers))
+            followers_offsets.append(len(followers_indices))
+            engagement.append(member.total_engagement())
+            for counts, offsets, indices, values in ((member.likes, likes_offsets, likes_indices, likes_counts),
+                                                     (member.comments, comments_offsets, comments_indices, comments_counts)):
+                indices.extend(index[other_id] for other_id in counts)
+                values.extend(counts.values())
+                offsets.append(len(indices))
+
+        return cls(member_ids, names, following_offsets, following_indices,
+                   followers_offsets, followers_indices, engagement,
+                   likes_offsets, likes_indices, likes_counts,
+                   comments_offsets, comments_indices, comments_counts)
+
+    @cached_property
+    def index(self):
+        return {member_id: i for i, member_id in enumerate(self.member_ids)}
+
+    @cached_property
+    def interactions(self):
+        # (from_id, to_id) -> likes + comments from_id gave to_id, built once
+        # per snapshot for the Dijkstra edge weights
+        member_ids = self.member_ids
+        interactions = {}
+        for i in range(len(self)):
+            for j, count in self.likes_of(i):
+                key = (member_ids[i], member_ids[j])
+                interactions[key] = interactions.get(key, 0) + count
+            for j, count in self.comments_of(i):
+                key = (member_ids[i], member_ids[j])
+                interactions[key] = interactions.get(key, 0) + count
+        return interactions
+
+    def __len__(self):
+        return len(self.member_ids)
+
+    def __contains__(self, member_id):
+        return member_id in self.index
+
+    def __reduce_ex__(self, protocol):
+        # A file-backed graph pickles as its path, so worker processes map the
+        # same file instead of receiving a copy of the arrays.
+        if self.source_path is not None:
+            from data_structures.graph_file import load_graph
+            return load_graph, (self.source_path,)
+        return super().__reduce_ex__(protocol)
+
+    @property
+    def edge_count(self):
+        return len(self.following_indices)
+
+    def following_of(self, i):
+        return self.following_indices[self.following_offsets[i]:self.following_offsets[i + 1]]
+
+    def followers_of(self, i):
+        return self.followers_indices[self.followers_offsets[i]:self.followers_offsets[i + 1]]
+
+    def likes_of(self, i):
+        start, end = self.likes_offsets[i], self.likes_offsets[i + 1]
+        return zip(self.likes_indices[start:end], self.likes_counts[start:end])
+
+    def comments_of(self, i):
+        start, end = self.comments_offsets[i], self.comments_offsets[i + 1]
+        return zip(self.comments_indices[start:end], self.comments_counts[start:end])
+
+    def out_degree(self, i):
+        return self.following_offsets[i + 1] - self.following_offsets[i]
+
+    def in_degree(self, i):
+        return self.followers_offsets[i + 1] - self.followers_offsets[i]
+
+    def path_ids(self, indices):
+        member_ids = self.member_ids
+        return [member_ids[i] for i in indices]
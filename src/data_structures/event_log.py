@@ -0,0 +1,54 @@
+import csv
+import json
+
+# Interaction logs hold one event per row/line: the event type (follow, like,
+# comment or their retractions unfollow, unlike, uncomment), the source and
+# target member ids and, for likes and comments, a count (1 when omitted).
+# CSV files may start with an "event,source,target,count" header; JSON Lines
+# records use the same keys.
+EVENT_TYPES = ('follow', 'like', 'comment', 'unfollow', 'unlike', 'uncomment')
+CSV_HEADER = ['event', 'source', 'target', 'count']
+IO_BUFFER_SIZE = 1 << 20
+
+def _format_from_path(path):
+    if path.endswith('.csv'):
+        return 'csv'
+    if path.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    raise ValueError(f"Cannot tell the event log format of {path}; pass fmt='csv' or fmt='jsonl'")
+
+def _parse_id(value):
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+def read_events(path, fmt=None):
+    # Generator over (event, source_id, target_id, count); the file is read
+    # through a large buffer and never held in memory as a whole.
+    fmt = fmt or _format_from_path(path)
+    with open(path, newline='', buffering=IO_BUFFER_SIZE) as f:
+        if fmt == 'csv':
+            for row in csv.reader(f):
+                if not row or row == CSV_HEADER:
+                    continue
+                count = int(row[3]) if len(row) > 3 and row[3] else 1
+                yield row[0], _parse_id(row[1]), _parse_id(row[2]), count
+        elif fmt == 'jsonl':
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record['event'], record['source'], record['target'], record.get('count', 1)
+        else:
+            raise ValueError(f"Unknown event log format: {fmt}")
+
+def write_events(events, path, fmt=None):
+    fmt = fmt or _format_from_path(path)
+    with open(path, 'w', newline='', buffering=IO_BUFFER_SIZE) as f:
+        if fmt == 'csv':
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADER)
+            writer.writerows(events)
+        else:
+            for event, source_id, target_id, count in events:
+                f.write(json.dumps({'event': event, 'source': source_id, 'target': target_id, 'count': count}) + '\n')
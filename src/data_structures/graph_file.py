@@ -0,0 +1,154 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from data_structures.csr_network import CSRNetwork
+from data_structures.network import Network
+
+# Binary graph file: an 8-byte magic, the section count, one (offset, length)
+# pair per section, then the sections themselves. Every section except the
+# UTF-8 names blob is a native int64 array starting on an 8-byte boundary, so
+# load_graph() can expose it as a zero-copy memoryview over an mmap.
+MAGIC = b'SNGRAPH1'
+SECTIONS = (
+    'member_ids', 'name_offsets', 'names',
+    'following_offsets', 'following_indices', 'followers_offsets', 'followers_indices',
+    'engagement',
+    'likes_offsets', 'likes_indices', 'likes_counts',
+    'comments_offsets', 'comments_indices', 'comments_counts',
+)
+HEADER = struct.Struct('<8sq')
+ENTRY = struct.Struct('<qq')
+
+# Landmark files (algorithms/landmarks.py) use the same layout with their own
+# magic: the landmark member indices and the forward/backward distance tables.
+LANDMARK_MAGIC = b'SNLMRKS1'
+LANDMARK_SECTIONS = ('landmarks', 'forward', 'backward')
+KINDS = {MAGIC: 'graph', LANDMARK_MAGIC: 'landmark'}
+
+class NameTable:
+    # Lazily decoded member names backed by an offsets array and a UTF-8 blob
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]]).decode('utf-8')
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+def _check_byteorder():
+    if sys.byteorder != 'little':
+        raise ValueError("graph files store little-endian int64 arrays")
+
+def _write_sections(path, magic, payloads):
+    blobs = [memoryview(payload).cast('B') for payload in payloads]
+    offset = HEADER.size + ENTRY.size * len(blobs)
+    entries = []
+    for blob in blobs:
+        entries.append((offset, len(blob)))
+        offset += len(blob) + (-len(blob) % 8)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(magic, len(blobs)))
+        for entry in entries:
+            f.write(ENTRY.pack(*entry))
+        for blob in blobs:
+            f.write(blob)
+            f.write(b'\0' * (-len(blob) % 8))
+
+def _read_sections(path, magic, names, raw=()):
+    # Maps the file and returns {section: memoryview}; every section not
+    # listed in raw is cast to int64. Truncated or inconsistent files raise
+    # ValueError before anything is unpacked or cast.
+    kind = KINDS[magic]
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < HEADER.size:
+            raise ValueError(f"corrupt {kind} file: {path}")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+
+    file_magic, section_count = HEADER.unpack_from(mapped, 0)
+    if file_magic != magic or section_count != len(names):
+        raise ValueError(f"{path} is not a {kind} file")
+    if size < HEADER.size + ENTRY.size * section_count:
+        raise ValueError(f"corrupt {kind} file: {path}")
+
+    sections = {}
+    for k, section in enumerate(names):
+        offset, length = ENTRY.unpack_from(mapped, HEADER.size + ENTRY.size * k)
+        if offset < 0 or length < 0 or offset + length > size:
+            raise ValueError(f"corrupt {kind} file: {path}")
+        sections[section] = view[offset:offset + length]
+        if section not in raw:
+            if offset % 8 or length % 8:
+                raise ValueError(f"corrupt {kind} file: {path}")
+            sections[section] = sections[section].cast('q')
+    return sections
+
+def save_graph(graph, path):
+    _check_byteorder()
+    try:
+        member_ids = array('q', graph.member_ids)
+    except (TypeError, OverflowError):
+        raise ValueError("graph files require integer member ids")
+
+    encoded_names = [name.encode('utf-8') for name in graph.names]
+    name_offsets = array('q', [0])
+    for name in encoded_names:
+        name_offsets.append(name_offsets[-1] + len(name))
+
+    payloads = {'member_ids': member_ids, 'name_offsets': name_offsets, 'names': b''.join(encoded_names)}
+    for section in SECTIONS[3:]:
+        payloads[section] = array('q', getattr(graph, section))
+
+    _write_sections(path, MAGIC, [payloads[section] for section in SECTIONS])
+
+def save_network(network, path):
+    save_graph(network.freeze(), path)
+
+def load_graph(path):
+    _check_byteorder()
+    sections = _read_sections(path, MAGIC, SECTIONS, raw=('names',))
+    size = len(sections['member_ids'])
+    for offsets, values in (('name_offsets', 'names'), ('following_offsets', 'following_indices'),
+                            ('followers_offsets', 'followers_indices'), ('likes_offsets', 'likes_indices'),
+                            ('comments_offsets', 'comments_indices')):
+        if len(sections[offsets]) != size + 1 or sections[offsets][-1] != len(sections[values]):
+            raise ValueError(f"corrupt graph file: {path}")
+    if (len(sections['engagement']) != size or len(sections['likes_counts']) != len(sections['likes_indices'])
+            or len(sections['comments_counts']) != len(sections['comments_indices'])):
+        raise ValueError(f"corrupt graph file: {path}")
+
+    graph = CSRNetwork(
+        sections['member_ids'], NameTable(sections['name_offsets'], sections['names']),
+        *(sections[section] for section in SECTIONS[3:]))
+    graph.source_path = os.path.abspath(path)
+    return graph
+
+def load_network(path):
+    return Network.from_graph(load_graph(path))
+
+def save_landmarks(oracle, path):
+    _check_byteorder()
+    _write_sections(path, LANDMARK_MAGIC, [array('q', getattr(oracle, section)) for section in LANDMARK_SECTIONS])
+
+def load_landmarks(path, graph):
+    # graph must be the graph the oracle was built from
+    from algorithms.landmarks import LandmarkOracle
+    _check_byteorder()
+    sections = _read_sections(path, LANDMARK_MAGIC, LANDMARK_SECTIONS)
+    landmarks, forward, backward = (sections[section] for section in LANDMARK_SECTIONS)
+    if len(forward) != len(backward) or len(forward) % max(len(landmarks), 1):
+        raise ValueError(f"corrupt landmark file: {path}")
+    if len(forward) != len(graph) * len(landmarks):
+        raise ValueError(f"{path} was built for a graph with a different number of members")
+    if any(not 0 <= landmark < len(graph) for landmark in landmarks):
+        raise ValueError(f"corrupt landmark file: {path}")
+    return LandmarkOracle(graph, *(sections[section] for section in LANDMARK_SECTIONS))
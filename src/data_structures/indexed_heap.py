@@ -0,0 +1,74 @@
+class IndexedHeap:
+    # Binary min-heap of (priority, key) entries with a key -> position index,
+    # so a key's priority can be lowered in place (decrease-key) instead of
+    # pushing a duplicate entry and skipping it later.
+    def __init__(self):
+        self.entries = []
+        self.positions = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.positions
+
+    def priority(self, key):
+        return self.entries[self.positions[key]][0]
+
+    def push(self, key, priority):
+        # Inserts key, or lowers its priority if it is already queued with a
+        # higher one. Returns True if the heap changed.
+        position = self.positions.get(key)
+        if position is None:
+            self.entries.append((priority, key))
+            self.positions[key] = len(self.entries) - 1
+            self._sift_up(len(self.entries) - 1)
+            return True
+        if priority < self.entries[position][0]:
+            self.entries[position] = (priority, key)
+            self._sift_up(position)
+            return True
+        return False
+
+    def pop(self):
+        # Removes and returns the (key, priority) with the lowest priority
+        entries, positions = self.entries, self.positions
+        priority, key = entries[0]
+        last = entries.pop()
+        del positions[key]
+        if entries:
+            entries[0] = last
+            positions[last[1]] = 0
+            self._sift_down(0)
+        return key, priority
+
+    def _sift_up(self, position):
+        entries, positions = self.entries, self.positions
+        entry = entries[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if entries[parent][0] <= entry[0]:
+                break
+            entries[position] = entries[parent]
+            positions[entries[position][1]] = position
+            position = parent
+        entries[position] = entry
+        positions[entry[1]] = position
+
+    def _sift_down(self, position):
+        entries, positions = self.entries, self.positions
+        size = len(entries)
+        entry = entries[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and entries[child + 1][0] < entries[child][0]:
+                child += 1
+            if entry[0] <= entries[child][0]:
+                break
+            entries[position] = entries[child]
+            positions[entries[position][1]] = position
+            position = child
+        entries[position] = entry
+        positions[entry[1]] = position
@@ -0,0 +1,86 @@
+import numpy as np
+from scipy import sparse
+
+class InteractionMatrices:
+    # Sparse export of a Network: likes[i, j] / comments[i, j] are what member
+    # i gave member j and following[i, j] is 1 when i follows j, with
+    # rows/columns in member_ids order.
+    def __init__(self, member_ids, likes, comments, followers_count, following_count, following):
+        self.member_ids = member_ids
+        self.index = {member_id: i for i, member_id in enumerate(member_ids)}
+        self.likes = likes
+        self.comments = comments
+        self.followers_count = followers_count
+        self.following_count = following_count
+        self.following = following
+
+    @classmethod
+    def from_members(cls, members):
+        member_ids = list(members)
+        index = {member_id: i for i, member_id in enumerate(member_ids)}
+        n = len(member_ids)
+
+        def to_matrix(attribute):
+            rows, cols, data = [], [], []
+            for i, member_id in enumerate(member_ids):
+                counts = getattr(members[member_id], attribute)
+                rows.extend([i] * len(counts))
+                cols.extend(index[other_id] for other_id in counts)
+                data.extend(counts.values())
+            matrix = sparse.csr_matrix((np.array(data, dtype=np.int64), (rows, cols)), shape=(n, n))
+            matrix.eliminate_zeros()
+            return matrix
+
+        followers_count = np.fromiter((len(members[m].followers) for m in member_ids), dtype=np.int64, count=n)
+        following_count = np.fromiter((len(members[m].following) for m in member_ids), dtype=np.int64, count=n)
+        rows = np.repeat(np.arange(n), following_count)
+        cols = np.fromiter((index[followee.member_id] for m in member_ids for followee in members[m].following),
+                           dtype=np.int64, count=int(following_count.sum()))
+        following = sparse.csr_matrix((np.ones(len(cols), dtype=np.int64), (rows, cols)), shape=(n, n))
+        return cls(member_ids, to_matrix('likes'), to_matrix('comments'), followers_count, following_count, following)
+
+    @classmethod
+    def from_graph(cls, graph):
+        # Same export straight from a CSRNetwork's arrays, without Members
+        n = len(graph)
+
+        def to_matrix(offsets, indices, counts):
+            offsets = np.asarray(offsets, dtype=np.int64)
+            data = np.ones(offsets[-1], dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+            matrix = sparse.csr_matrix((data, np.asarray(indices, dtype=np.int64), offsets), shape=(n, n))
+            matrix.sum_duplicates()
+            matrix.eliminate_zeros()
+            return matrix
+
+        following = to_matrix(graph.following_offsets, graph.following_indices, None)
+        return cls(list(graph.member_ids),
+                   to_matrix(graph.likes_offsets, graph.likes_indices, graph.likes_counts),
+                   to_matrix(graph.comments_offsets, graph.comments_indices, graph.comments_counts),
+                   np.diff(np.asarray(graph.followers_offsets, dtype=np.int64)),
+                   np.diff(np.asarray(graph.following_offsets, dtype=np.int64)),
+                   following)
+
+    def engagement(self):
+        return self.likes + self.comments
+
+    def follow_weights(self):
+        # weight[i, j] = 1 + likes + comments i gave j, on follow edges only
+        following = self.following.astype(float)
+        return (following + following.multiply(self.engagement())).tocsr()
+
+    def total_engagement(self):
+        return np.asarray(self.engagement().sum(axis=1)).ravel()
+
+    def engagement_rates(self):
+        # Vectorised Member.engagement_rate() for every member
+        rates = np.zeros(len(self.member_ids))
+        has_followers = self.followers_count > 0
+        rates[has_followers] = self.total_engagement()[has_followers] / self.followers_count[has_followers] * 100
+        return rates
+
+    def influence_matrix(self):
+        # influence[i, j] == members[i].influence_on(members[j]): the share of
+        # i's engagement that j gave back to i, as a percentage
+        totals = self.total_engagement().astype(float)
+        scale = np.divide(100.0, totals, out=np.zeros_like(totals), where=totals > 0)
+        return sparse.diags(scale) @ self.engagement().T.tocsr()
@@ -1,42 +1,139 @@
-from collections import defaultdict
+class Counts(dict):
+    # Interaction counts; reading a missing member gives 0 without inserting it
+    __slots__ = ()
+
+    def __missing__(self, key):
+        return 0
+
+def _frozen(*args, **kwargs):
+    raise TypeError("shared empty maps are read-only; Member allocates its own on first write")
+
+class EmptyCounts(Counts):
+    # Shared read-only stand-in for a Member's interaction maps until the
+    # first like/comment allocates a real one
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = update = setdefault = pop = popitem = clear = _frozen
+
+    def __reduce__(self):
+        return 'EMPTY_COUNTS'
+
+class EmptyMembers(frozenset):
+    # Shared stand-in for followers/following until the first follow
+    __slots__ = ()
+
+    def __reduce__(self):
+        return 'EMPTY_MEMBERS'
+
+EMPTY_COUNTS = EmptyCounts()
+EMPTY_MEMBERS = EmptyMembers()
 
 class Member:
+    __slots__ = ('member_id', 'name', 'followers', 'following', 'likes', 'comments', 'likes_to', 'comments_to',
+                 'likes_given_total', 'comments_given_total', 'likes_received_total', 'comments_received_total',
+                 # set by utils.generate_progressive_networks / calculate_influence
+                 'engagement_rate_value', 'influences')
+
     def __init__(self, member_id, name):
         self.member_id = member_id
         self.name = name
-        self.followers = set()
-        self.following = set()
-        self.likes = defaultdict(int)
-        self.comments = defaultdict(int)
-        self.likes_to = defaultdict(int)
-        self.comments_to = defaultdict(int)
-        # BFS attributes
-        self.color = 'WHITE'
-        self.distance = float('inf')
-        self.predecessor = None
+        # Sets and maps start as the shared empty instances and are allocated
+        # on first write, so members who never interact stay small. Change
+        # them only through the methods below (or Network's wrappers): the
+        # shared instances are read-only.
+        self.followers = EMPTY_MEMBERS
+        self.following = EMPTY_MEMBERS
+        self.likes = EMPTY_COUNTS
+        self.comments = EMPTY_COUNTS
+        self.likes_to = EMPTY_COUNTS
+        self.comments_to = EMPTY_COUNTS
+        # Running totals kept in step with the dicts above
+        self.likes_given_total = 0
+        self.comments_given_total = 0
+        self.likes_received_total = 0
+        self.comments_received_total = 0
 
     def follow(self, other):
+        if self.following is EMPTY_MEMBERS:
+            self.following = set()
+        if other.followers is EMPTY_MEMBERS:
+            other.followers = set()
         self.following.add(other)
         other.followers.add(self)
 
     def like(self, other, count=1):
+        if self.likes is EMPTY_COUNTS:
+            self.likes = Counts()
+        if other.likes_to is EMPTY_COUNTS:
+            other.likes_to = Counts()
         self.likes[other.member_id] += count
         other.likes_to[self.member_id] += count
+        self.likes_given_total += count
+        other.likes_received_total += count
 
     def comment(self, other, count=1):
+        if self.comments is EMPTY_COUNTS:
+            self.comments = Counts()
+        if other.comments_to is EMPTY_COUNTS:
+            other.comments_to = Counts()
         self.comments[other.member_id] += count
         other.comments_to[self.member_id] += count
+        self.comments_given_total += count
+        other.comments_received_total += count
+
+    # Removals mirror follow/like/comment and are O(1). Retracting more than
+    # was given removes the whole entry; the amount removed is returned.
+    def unfollow(self, other):
+        # Returns whether there was an edge to remove
+        if other not in self.following:
+            return False
+        self.following.discard(other)
+        other.followers.discard(self)
+        return True
+
+    def unlike(self, other, count=None):
+        given = self.likes.get(other.member_id, 0)
+        count = given if count is None else min(count, given)
+        if count <= 0:
+            return 0
+        if count == given:
+            del self.likes[other.member_id]
+            del other.likes_to[self.member_id]
+        else:
+            self.likes[other.member_id] -= count
+            other.likes_to[self.member_id] -= count
+        self.likes_given_total -= count
+        other.likes_received_total -= count
+        return count
+
+    def uncomment(self, other, count=None):
+        given = self.comments.get(other.member_id, 0)
+        count = given if count is None else min(count, given)
+        if count <= 0:
+            return 0
+        if count == given:
+            del self.comments[other.member_id]
+            del other.comments_to[self.member_id]
+        else:
+            self.comments[other.member_id] -= count
+            other.comments_to[self.member_id] -= count
+        self.comments_given_total -= count
+        other.comments_received_total -= count
+        return count
 
     def engagement_rate(self):
         followers_count = len(self.followers)
         if followers_count == 0:
             return 0.0
-        total_likes = sum(self.likes.values())
-        total_comments = sum(self.comments.values())
-        return (total_likes + total_comments) / followers_count * 100
+        return self.total_engagement() / followers_count * 100
 
     def total_engagement(self):
-        return sum(self.likes.values()) + sum(self.comments.values())
+        return self.likes_given_total + self.comments_given_total
+
+    def counters_consistent(self):
+        return (self.likes_given_total == sum(self.likes.values())
+                and self.comments_given_total == sum(self.comments.values())
+                and self.likes_received_total == sum(self.likes_to.values())
+                and self.comments_received_total == sum(self.comments_to.values()))
 
     def influence_on(self, other):
         total_engagement = self.total_engagement()
@@ -1,27 +1,182 @@
+import heapq
 from collections import defaultdict
 from data_structures.member import Member
+from data_structures.csr_network import CSRNetwork
+from data_structures.event_log import EVENT_TYPES
 
 class Network:
     def __init__(self):
         self.members = {}
+        # version is bumped by every mutation, follow_version only by those
+        # that change the follow graph; listeners are called with
+        # (event, source_id, target_id) after the mutation is applied
+        self.version = 0
+        self.follow_version = 0
+        self.listeners = []
+        self._reachability = None
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def _changed(self, event, source_id, target_id):
+        self.version += 1
+        if event in ('follow', 'unfollow', 'add_member'):
+            self.follow_version += 1
+        for listener in self.listeners:
+            listener(event, source_id, target_id)
 
     def add_member(self, member_id, name):
         self.members[member_id] = Member(member_id, name)
+        self._changed('add_member', member_id, None)
 
     def follow(self, follower_id, followee_id):
         follower = self.members[follower_id]
         followee = self.members[followee_id]
         follower.follow(followee)
+        self._changed('follow', follower_id, followee_id)
 
     def like(self, liker_id, likee_id, amount):
         liker = self.members[liker_id]
         likee = self.members[likee_id]
         liker.like(likee, amount)
+        self._changed('like', liker_id, likee_id)
 
     def comment(self, commenter_id, commente_id, amount):
         commenter = self.members[commenter_id]
         commente = self.members[commente_id]
         commenter.comment(commente, amount)
+        self._changed('comment', commenter_id, commente_id)
+
+    def unfollow(self, follower_id, followee_id):
+        follower = self.members[follower_id]
+        followee = self.members[followee_id]
+        # Retractions that remove nothing don't count as changes
+        removed = follower.unfollow(followee)
+        if removed:
+            self._changed('unfollow', follower_id, followee_id)
+        return removed
+
+    def unlike(self, liker_id, likee_id, amount=None):
+        # amount=None retracts every like liker gave likee
+        liker = self.members[liker_id]
+        likee = self.members[likee_id]
+        removed = liker.unlike(likee, amount)
+        if removed:
+            self._changed('unlike', liker_id, likee_id)
+        return removed
+
+    def uncomment(self, commenter_id, commente_id, amount=None):
+        commenter = self.members[commenter_id]
+        commente = self.members[commente_id]
+        removed = commenter.uncomment(commente, amount)
+        if removed:
+            self._changed('uncomment', commenter_id, commente_id)
+        return removed
+
+    def ingest(self, events):
+        # Applies an iterable of (event, source_id, target_id, count) tuples,
+        # e.g. from event_log.read_events, creating unknown members as they
+        # appear. Each event's type is checked before any of its members are
+        # created, but ingest is not atomic: when an event is rejected, the
+        # events before it stay applied. Returns the number of events applied.
+        members = self.members
+        applied = 0
+        for event, source_id, target_id, count in events:
+            if event not in EVENT_TYPES:
+                raise ValueError(f"Unknown event type: {event}")
+            for member_id in (source_id, target_id):
+                if member_id not in members:
+                    self.add_member(member_id, f'Member{member_id}')
+            if event in ('follow', 'unfollow'):
+                getattr(self, event)(source_id, target_id)
+            else:
+                getattr(self, event)(source_id, target_id, count)
+            applied += 1
+        return applied
+
+    # Received engagement, served from the reverse maps and totals that
+    # Member.like / Member.comment maintain on the receiving member
+    def likes_received(self, member_id):
+        return self.members[member_id].likes_received_total
+
+    def comments_received(self, member_id):
+        return self.members[member_id].comments_received_total
+
+    def likes_received_from(self, member_id):
+        return dict(self.members[member_id].likes_to)
+
+    def comments_received_from(self, member_id):
+        return dict(self.members[member_id].comments_to)
+
+    # Top-k queries use heap selection over members / recorded interactions,
+    # so they never materialise all N^2 influence values
+    def top_influencers(self, k):
+        rated = ((member_id, member.engagement_rate()) for member_id, member in self.members.items())
+        return heapq.nlargest(k, rated, key=lambda item: item[1])
+
+    def top_influence_targets(self, member_id, k):
+        edges = heapq.nlargest(k, self._influence_edges(self.members[member_id]), key=lambda item: item[2])
+        return [(target_id, influence) for _, target_id, influence in edges]
+
+    def strongest_influence_edges(self, k):
+        edges = (edge for member in self.members.values() for edge in self._influence_edges(member))
+        return heapq.nlargest(k, edges, key=lambda item: item[2])
+
+    @staticmethod
+    def _influence_edges(member):
+        # Yields (member_id, other_id, member.influence_on(other)) for every
+        # member whose influence is non-zero, i.e. who interacted with member
+        total_engagement = member.total_engagement()
+        if total_engagement == 0:
+            return
+        for other_id in member.likes_to.keys() | member.comments_to.keys():
+            interactions = member.likes_to.get(other_id, 0) + member.comments_to.get(other_id, 0)
+            if interactions:
+                yield member.member_id, other_id, interactions / total_engagement * 100
+
+    @classmethod
+    def from_graph(cls, graph):
+        # Rebuilds a mutable Network from a CSRNetwork snapshot
+        network = cls()
+        member_ids = graph.member_ids
+        for member_id, name in zip(member_ids, graph.names):
+            network.add_member(member_id, name)
+        for i, member_id in enumerate(member_ids):
+            for j in graph.following_of(i):
+                network.follow(member_id, member_ids[j])
+            for j, count in graph.likes_of(i):
+                network.like(member_id, member_ids[j], count)
+            for j, count in graph.comments_of(i):
+                network.comment(member_id, member_ids[j], count)
+        return network
+
+    def freeze(self):
+        return CSRNetwork.from_members(self.members)
+
+    def reachability_index(self):
+        # Built over a frozen snapshot on first use and rebuilt once the
+        # follow graph has changed since; likes and comments don't affect it
+        if self._reachability is None or self._reachability[0] != self.follow_version:
+            from algorithms.scc import ReachabilityIndex
+            self._reachability = (self.follow_version, ReachabilityIndex(self.freeze()))
+        return self._reachability[1]
+
+    def reachable(self, start_id, end_id):
+        return self.reachability_index().reachable(start_id, end_id)
+
+    def to_interaction_matrices(self):
+        # NumPy/SciPy are only needed for the vectorised analytics
+        from data_structures.interaction_matrices import InteractionMatrices
+        return InteractionMatrices.from_members(self.members)
+
+    def influence_ranking(self, **options):
+        # Weighted (or, with seeds=..., personalised) PageRank; see
+        # PageRank.influence_scores for the options
+        from algorithms.pagerank import PageRank
+        return PageRank.influence_scores(self.to_interaction_matrices(), **options)
 
     def ensure_required_path(self, path):
         for i in range(len(path) - 1):
@@ -38,10 +193,11 @@ class Network:
         self.ensure_required_path(specific_path)
 
         # Generate additional random followings while avoiding creating shorter paths
+        path_edges = set(zip(specific_path, specific_path[1:]))
         while num_followings > 0:
             follower_id = random.randint(1, num_members)
             followee_id = random.randint(1, num_members)
-            if follower_id != followee_id and (follower_id, followee_id) not in zip(specific_path, specific_path[1:]):
+            if follower_id != followee_id and (follower_id, followee_id) not in path_edges:
                 self.follow(follower_id, followee_id)
                 num_followings -= 1
 
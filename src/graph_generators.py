@@ -0,0 +1,109 @@
+from array import array
+import numpy as np
+from data_structures.csr_network import CSRNetwork
+
+# Seeded, vectorised synthetic follow graphs for benchmarking at scale. Each
+# generator draws all edges as NumPy arrays and writes them straight into a
+# CSRNetwork (member ids 1..n), skipping Member objects entirely; use
+# Network.from_graph() when a mutable Network is needed.
+
+class GeneratedNames:
+    # Member names computed on demand instead of stored
+    def __init__(self, count):
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return f'Member{i + 1}'
+
+    def __iter__(self):
+        return (f'Member{i}' for i in range(1, self.count + 1))
+
+def erdos_renyi(num_members, avg_out_degree, seed=None, like_probability=0.3, comment_probability=0.1):
+    # Every member follows a Poisson(avg_out_degree) number of uniformly random members
+    rng = np.random.default_rng(seed)
+    sources = np.repeat(np.arange(num_members), rng.poisson(avg_out_degree, num_members))
+    targets = rng.integers(0, num_members, len(sources))
+    return _build_graph(rng, num_members, sources, targets, like_probability, comment_probability)
+
+def power_law(num_members, avg_out_degree, exponent=2.1, seed=None, like_probability=0.3, comment_probability=0.1):
+    # Chung-Lu style preferential attachment: follower and followee endpoints
+    # are drawn with probability proportional to power-law member weights,
+    # giving heavy-tailed in- and out-degree distributions.
+    rng = np.random.default_rng(seed)
+    num_edges = int(num_members * avg_out_degree)
+    weights = np.arange(1, num_members + 1, dtype=float) ** (-1.0 / (exponent - 1))
+
+    def draw():
+        # Searching with sorted queries is much faster than with random ones;
+        # the result is shuffled afterwards so the endpoints pair up randomly.
+        cumulative = np.cumsum(weights[rng.permutation(num_members)])
+        queries = np.sort(rng.random(num_edges)) * cumulative[-1]
+        return rng.permutation(np.searchsorted(cumulative, queries, side='right'))
+
+    sources = draw()
+    targets = draw()
+    return _build_graph(rng, num_members, sources, targets, like_probability, comment_probability)
+
+def community(num_members, avg_out_degree, num_communities=10, mixing=0.1, seed=None,
+              like_probability=0.3, comment_probability=0.1):
+    # Stochastic block model: members are split into equal contiguous
+    # communities; each follow stays inside the follower's community with
+    # probability 1 - mixing and otherwise picks a uniformly random member.
+    rng = np.random.default_rng(seed)
+    sources = np.repeat(np.arange(num_members), rng.poisson(avg_out_degree, num_members))
+    community_of = sources * num_communities // num_members
+    starts = -(-community_of * num_members // num_communities)
+    ends = -(-(community_of + 1) * num_members // num_communities)
+    targets = starts + (rng.random(len(sources)) * (ends - starts)).astype(np.int64)
+    mixed = rng.random(len(sources)) < mixing
+    targets[mixed] = rng.integers(0, num_members, int(mixed.sum()))
+    return _build_graph(rng, num_members, sources, targets, like_probability, comment_probability)
+
+def _to_array(values):
+    result = array('q')
+    result.frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+    return result
+
+def _offsets(keys, num_members):
+    return np.concatenate(([0], np.cumsum(np.bincount(keys, minlength=num_members))))
+
+def _build_graph(rng, num_members, sources, targets, like_probability, comment_probability):
+    # Drop self-follows and duplicates; sorting the edge keys also orders
+    # the edges by follower
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    keep = sources != targets
+    edges = np.sort(sources[keep] * num_members + targets[keep])
+    edges = edges[np.concatenate(([True], edges[1:] != edges[:-1]))]
+    sources, targets = edges // num_members, edges % num_members
+
+    following_offsets = _offsets(sources, num_members)
+    by_followee = np.argsort(targets, kind='stable')
+    followers_offsets = _offsets(targets, num_members)
+    followers_indices = sources[by_followee]
+
+    # Likes and comments land on a random subset of follow edges with
+    # geometric (mostly small, occasionally large) counts
+    interactions = []
+    for probability, mean_count in ((like_probability, 3.0), (comment_probability, 1.5)):
+        chosen = rng.random(len(edges)) < probability
+        counts = rng.geometric(1.0 / mean_count, int(chosen.sum()))
+        interactions.append((_offsets(sources[chosen], num_members), targets[chosen], counts, sources[chosen]))
+
+    engagement = np.zeros(num_members, dtype=np.int64)
+    for _, _, counts, givers in interactions:
+        np.add.at(engagement, givers, counts)
+
+    (likes_offsets, likes_indices, likes_counts, _), (comments_offsets, comments_indices, comments_counts, _) = interactions
+    return CSRNetwork(
+        list(range(1, num_members + 1)), GeneratedNames(num_members),
+        _to_array(following_offsets), _to_array(targets),
+        _to_array(followers_offsets), _to_array(followers_indices),
+        _to_array(engagement),
+        _to_array(likes_offsets), _to_array(likes_indices), _to_array(likes_counts),
+        _to_array(comments_offsets), _to_array(comments_indices), _to_array(comments_counts))
@@ -0,0 +1,76 @@
+# Structured counterparts of the per-step trace. The path algorithms take an
+# optional `stats` collector (anything with a record(TraversalStats) method)
+# and only count into locals while running, recording one TraversalStats at
+# the end; when no collector is passed nothing is counted or timed.
+
+class TraversalStats:
+    FIELDS = ('nodes_visited', 'edges_relaxed', 'heap_pushes', 'heap_pops', 'max_frontier', 'elapsed')
+
+    def __init__(self, algorithm, nodes_visited=0, edges_relaxed=0, heap_pushes=0, heap_pops=0,
+                 max_frontier=0, elapsed=0.0):
+        self.algorithm = algorithm
+        self.nodes_visited = nodes_visited
+        self.edges_relaxed = edges_relaxed
+        self.heap_pushes = heap_pushes
+        self.heap_pops = heap_pops
+        self.max_frontier = max_frontier
+        self.elapsed = elapsed
+
+    def as_dict(self):
+        return {'algorithm': self.algorithm, **{field: getattr(self, field) for field in self.FIELDS}}
+
+    def __repr__(self):
+        counters = ', '.join(f"{field}={getattr(self, field)}" for field in self.FIELDS)
+        return f"TraversalStats({self.algorithm}, {counters})"
+
+class StatsCollector:
+    # Aggregates TraversalStats per algorithm across any number of queries
+    def __init__(self, keep_queries=False):
+        self.totals = {}
+        self.maxima = {}
+        self.queries = {}
+        self.keep_queries = keep_queries
+        self.history = []
+
+    def record(self, stats):
+        algorithm = stats.algorithm
+        if algorithm not in self.totals:
+            self.totals[algorithm] = dict.fromkeys(TraversalStats.FIELDS, 0)
+            self.maxima[algorithm] = dict.fromkeys(TraversalStats.FIELDS, 0)
+            self.queries[algorithm] = 0
+        totals, maxima = self.totals[algorithm], self.maxima[algorithm]
+        for field in TraversalStats.FIELDS:
+            value = getattr(stats, field)
+            totals[field] += value
+            if value > maxima[field]:
+                maxima[field] = value
+        self.queries[algorithm] += 1
+        if self.keep_queries:
+            self.history.append(stats)
+
+    def reset(self):
+        self.__init__(self.keep_queries)
+
+    def summary(self):
+        # algorithm -> {'queries': n, field: {'total', 'mean', 'max'}}
+        result = {}
+        for algorithm, totals in self.totals.items():
+            queries = self.queries[algorithm]
+            result[algorithm] = {'queries': queries}
+            for field in TraversalStats.FIELDS:
+                result[algorithm][field] = {
+                    'total': totals[field],
+                    'mean': totals[field] / queries,
+                    'max': self.maxima[algorithm][field],
+                }
+        return result
+
+    def format_summary(self):
+        lines = [f"{'algorithm':>14} {'queries':>8} " + ' '.join(f"{field:>14}" for field in TraversalStats.FIELDS)]
+        for algorithm, fields in sorted(self.summary().items()):
+            means = ' '.join(
+                f"{fields[field]['mean']:14.6f}" if field == 'elapsed' else f"{fields[field]['mean']:14.1f}"
+                for field in TraversalStats.FIELDS
+            )
+            lines.append(f"{algorithm:>14} {fields['queries']:8d} {means}")
+        return '\n'.join(lines) + '\n'
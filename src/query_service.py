@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from algorithms.bfs import BFS
+from algorithms.dfs import DFS
+from algorithms.incremental_bfs import IncrementalBFS
+
+class LRUCache:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.updates = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, keys):
+        for key in keys:
+            del self.entries[key]
+        self.invalidations += len(keys)
+
+    def clear(self):
+        self.entries.clear()
+
+    def info(self):
+        return {'hits': self.hits, 'misses': self.misses, 'invalidations': self.invalidations,
+                'updates': self.updates, 'size': len(self.entries), 'maxsize': self.maxsize}
+
+class PathQueryService:
+    # Answers shortest-path and highest-engagement-path queries against a
+    # Network, caching single-source BFS trees and DFS results in bounded LRU
+    # caches. The service listens to the network's mutations: new and
+    # removed follow edges are applied to the cached trees incrementally (so
+    # trees handed out earlier stay current), and DFS results are dropped
+    # only when a change can affect them.
+    def __init__(self, network, maxsize=1024):
+        self.network = network
+        self.trees = LRUCache(maxsize)
+        self.engagement_paths = LRUCache(maxsize)
+        network.add_listener(self._on_change)
+
+    def close(self):
+        self.network.remove_listener(self._on_change)
+
+    def shortest_paths_from(self, start_id):
+        tree = self.trees.get(start_id)
+        if tree is None:
+            tree = BFS.shortest_paths_from(self.network.members, start_id)
+            self.trees.put(start_id, tree)
+        return tree
+
+    def shortest_path(self, start_id, end_id):
+        return self.shortest_paths_from(start_id).path_to(end_id)
+
+    def highest_engagement_path(self, start_id, end_id, max_depth=5):
+        key = (start_id, end_id, max_depth)
+        entry = self.engagement_paths.get(key)
+        if entry is None:
+            # The start member's BFS tree is kept with the result to decide
+            # which later mutations can affect it
+            result = DFS.highest_engagement_path(self.network.members, start_id, end_id, max_depth=max_depth)
+            entry = (result, self.shortest_paths_from(start_id))
+            self.engagement_paths.put(key, entry)
+        path, engagement = entry[0]
+        return list(path), engagement
+
+    def cache_info(self):
+        return {'trees': self.trees.info(), 'engagement_paths': self.engagement_paths.info(),
+                'version': self.network.version}
+
+    def clear(self):
+        self.trees.clear()
+        self.engagement_paths.clear()
+
+    @staticmethod
+    def _tree_affected(tree, event, source_id, target_id):
+        # A new follow edge source -> target changes the tree only if it
+        # reaches a new member or shortens a distance, a removed one only if
+        # it is a tree edge; likes and comments don't change hop distances.
+        # Replacing an existing member drops its edges, so every tree
+        # containing it is affected.
+        if event == 'follow':
+            if source_id not in tree:
+                return False
+            return tree.distance_to(target_id) > tree.distances[source_id] + 1
+        if event == 'unfollow':
+            return tree.predecessors.get(target_id) == source_id
+        if event == 'add_member':
+            return source_id in tree
+        return False
+
+    @staticmethod
+    def _engagement_path_affected(entry, event, source_id, target_id, max_depth):
+        # Only members within max_depth hops of the start can be on a
+        # candidate path, so a change by anyone further away is irrelevant.
+        _, tree = entry
+        if PathQueryService._tree_affected(tree, event, source_id, target_id):
+            return True
+        return tree.distance_to(source_id) <= max_depth
+
+    def _on_change(self, event, source_id, target_id):
+        # DFS entries are checked first, against their trees as they were
+        # before this change
+        stale = [key for key, entry in self.engagement_paths.entries.items()
+                 if self._engagement_path_affected(entry, event, source_id, target_id, key[2])]
+        if stale:
+            self.engagement_paths.invalidate(stale)
+
+        affected = [start_id for start_id, tree in self.trees.entries.items()
+                    if self._tree_affected(tree, event, source_id, target_id)]
+        if event == 'follow':
+            for start_id in affected:
+                IncrementalBFS.insert_edge(self.network.members, self.trees.entries[start_id], source_id, target_id)
+            self.trees.updates += len(affected)
+        elif event == 'unfollow':
+            for start_id in affected:
+                IncrementalBFS.delete_edge(self.network.members, self.trees.entries[start_id], source_id, target_id)
+            self.trees.updates += len(affected)
+        elif affected:
+            self.trees.invalidate(affected)
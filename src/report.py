@@ -0,0 +1,198 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from algorithms.bfs import BFS
+from algorithms.dfs import DFS
+from algorithms.dijkstra import Dijkstra
+from algorithms.scc import ReachabilityIndex
+from utils import set_tracing, tracing_enabled
+
+BFS_MODES = ('tree', 'pairwise', 'bidirectional')
+
+# The report is produced as a stream of per-member sections and written
+# through one large buffer instead of many small unbuffered writes.
+REPORT_BUFFER_SIZE = 1 << 20
+
+def bfs_path_finder(graph, member_id, bfs_mode):
+    # Returns a callable other_id -> shortest path (or None) for the chosen mode
+    if bfs_mode == 'tree':
+        return BFS.shortest_paths_from(graph, member_id).path_to
+    if bfs_mode == 'bidirectional':
+        return lambda other_id: BFS.bidirectional_shortest_path(graph, member_id, other_id)
+    return lambda other_id: BFS.shortest_path(graph, member_id, other_id)
+
+def network_summary(network, size):
+    total_members = len(network.members)
+    total_followings = sum(len(member.following) for member in network.members.values())
+    total_likes = sum(member.likes_given_total for member in network.members.values())
+    total_comments = sum(member.comments_given_total for member in network.members.values())
+    return _format_network_summary(size, total_members, total_followings, total_likes, total_comments)
+
+def graph_summary(graph, size):
+    # network_summary() straight from a CSRNetwork, without Members
+    return _format_network_summary(size, len(graph), graph.edge_count, sum(graph.likes_counts), sum(graph.comments_counts))
+
+def _format_network_summary(size, total_members, total_followings, total_likes, total_comments):
+    total_engagements = total_likes + total_comments
+
+    return (
+        f"\n{'='*10} Testing Network of Size {size} {'='*10}\n"
+        f"Total members: {total_members}\n"
+        f"Total followings: {total_followings}\n"
+        f"Total likes: {total_likes}\n"
+        f"Total comments: {total_comments}\n"
+        f"Total engagements: {total_engagements}\n"
+    )
+
+def member_summary(network, member_id):
+    member = network.members[member_id]
+    return _format_member_summary(member_id, len(member.following), len(member.followers),
+                                  dict(member.likes), dict(member.comments),
+                                  network.likes_received(member_id), network.comments_received(member_id))
+
+def received_totals(graph):
+    # (likes received, comments received) per CSR position, for graph_member_summary()
+    likes_received = [0] * len(graph)
+    comments_received = [0] * len(graph)
+    for target, count in zip(graph.likes_indices, graph.likes_counts):
+        likes_received[target] += count
+    for target, count in zip(graph.comments_indices, graph.comments_counts):
+        comments_received[target] += count
+    return likes_received, comments_received
+
+def graph_member_summary(graph, member_id, received):
+    # member_summary() straight from a CSRNetwork, without Members
+    i = graph.index[member_id]
+    member_ids = graph.member_ids
+    likes = {member_ids[j]: count for j, count in graph.likes_of(i)}
+    comments = {member_ids[j]: count for j, count in graph.comments_of(i)}
+    return _format_member_summary(member_id, graph.out_degree(i), graph.in_degree(i), likes, comments,
+                                  received[0][i], received[1][i])
+
+def _format_member_summary(member_id, following_count, followers_count, likes, comments, likes_received, comments_received):
+    total_likes_given = sum(likes.values())
+    total_comments_given = sum(comments.values())
+
+    # Engagement rate calculation
+    if followers_count > 0:
+        engagement_rate = (total_likes_given + total_comments_given) / followers_count * 100
+    else:
+        engagement_rate = 0.0
+
+    lines = [
+        f"\nMember {member_id}: Follows {following_count} others, Followed by {followers_count}\n"
+        f"Likes given: {likes} (Total given: {total_likes_given})\n"
+        f"Likes received: {likes_received}\n"
+        f"Comments given: {comments} (Total given: {total_comments_given})\n"
+        f"Comments received: {comments_received}\n"
+        f"Engagement rate: {engagement_rate:.2f}\n"
+    ]
+
+    # Influence calculations for each member
+    interacted_members = set(likes.keys()).union(set(comments.keys()))
+    for followee_id in interacted_members:
+        likes_to = likes.get(followee_id, 0)
+        comments_to = comments.get(followee_id, 0)
+        if engagement_rate != 0:
+            influence_to_followee = (likes_to + comments_to) / engagement_rate
+        else:
+            influence_to_followee = 0.0
+
+        lines.append(f"Influence to Member {followee_id}: {influence_to_followee:.2f}\n")
+        lines.append(f"Calculation: ({likes_to} likes + {comments_to} comments) / {engagement_rate:.2f} engagement rate\n")
+    return ''.join(lines)
+
+def member_paths(graph, member_id, bfs_mode='tree', reachability=None):
+    # BFS, DFS and Dijkstra paths from member_id to every other member; only
+    # needs the frozen graph, so it can run away from the Network objects.
+    # With a ReachabilityIndex, pairs without any path are skipped before
+    # running the searches.
+    find_bfs_path = bfs_path_finder(graph, member_id, bfs_mode)
+    lines = []
+    for other_id in graph.member_ids:
+        if member_id == other_id:
+            continue
+        if reachability is not None and not reachability.reachable(member_id, other_id):
+            continue
+
+        path_bfs = find_bfs_path(other_id)
+        if path_bfs:
+            lines.append(
+                f"Shortest path to member {other_id} using BFS: {len(path_bfs) - 1} steps\n"
+                f"Path: {path_bfs}\n"
+            )
+
+        path_dfs, max_engagement = DFS.highest_engagement_path(graph, member_id, other_id)
+        if path_dfs:
+            lines.append(
+                f"Highest engagement path to member {other_id} using DFS: {len(path_dfs) - 1} steps\n"
+                f"Engagement score: {max_engagement}\n"
+                f"Path: {path_dfs}\n"
+            )
+
+        path_dijkstra = Dijkstra.traverse_members(graph, member_id, other_id)
+        if path_dijkstra:
+            lines.append(
+                f"Shortest path to member {other_id} using Dijkstra's: {len(path_dijkstra) - 1} steps\n"
+                f"Path: {path_dijkstra}\n"
+            )
+    return ''.join(lines)
+
+# Per-process state for parallel path analysis. Each worker receives the
+# frozen CSR graph once through the pool initializer (inherited without a
+# copy under fork) instead of having Member object graphs pickled per task.
+_worker_graph = None
+_worker_bfs_mode = None
+_worker_reachability = None
+
+def _init_worker(graph, bfs_mode, trace):
+    global _worker_graph, _worker_bfs_mode, _worker_reachability
+    _worker_graph, _worker_bfs_mode = graph, bfs_mode
+    _worker_reachability = ReachabilityIndex(graph)
+    set_tracing(trace)
+
+def _shard_paths(source_ids):
+    return [member_paths(_worker_graph, member_id, _worker_bfs_mode, _worker_reachability) for member_id in source_ids]
+
+def parallel_member_paths(graph, source_ids, bfs_mode='tree', workers=None):
+    # Yields member_paths() for each source in source_ids order; sources are
+    # sharded across a process pool and shards are merged back in order.
+    source_ids = list(source_ids)
+    workers = workers or os.cpu_count() or 1
+    shard_size = max(1, len(source_ids) // (workers * 4))
+    shards = [source_ids[i:i + shard_size] for i in range(0, len(source_ids), shard_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(graph, bfs_mode, tracing_enabled())) as executor:
+        for paths in executor.map(_shard_paths, shards):
+            yield from paths
+
+def network_sections(network, size, bfs_mode='tree', source_ids=None, workers=1, graph=None):
+    # graph may be a file-backed snapshot of network (graph_file.load_graph),
+    # which parallel workers then map from disk instead of receiving a copy.
+    # With network=None every section is built from graph alone, so no
+    # Member objects are created.
+    if network is None:
+        yield graph_summary(graph, size)
+        received = received_totals(graph)
+        summarise = lambda member_id: graph_member_summary(graph, member_id, received)
+    else:
+        yield network_summary(network, size)
+        summarise = lambda member_id: member_summary(network, member_id)
+    if graph is None:
+        reachability = network.reachability_index()
+        graph = reachability.graph
+    else:
+        reachability = ReachabilityIndex(graph)
+    if source_ids is None:
+        source_ids = graph.member_ids if network is None else network.members
+    source_ids = list(source_ids)
+    if workers == 1:
+        paths = (member_paths(graph, member_id, bfs_mode, reachability) for member_id in source_ids)
+    else:
+        paths = parallel_member_paths(graph, source_ids, bfs_mode, workers)
+    for member_id, member_paths_section in zip(source_ids, paths):
+        yield summarise(member_id)
+        yield member_paths_section
+
+def write_report(path, sections, buffer_size=REPORT_BUFFER_SIZE):
+    with open(path, "w", buffering=buffer_size) as f:
+        f.writelines(sections)
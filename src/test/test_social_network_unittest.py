@@ -22,6 +22,23 @@ from algorithms.dfs import DFS
 from algorithms.dijkstra import Dijkstra
 from utils import generate_progressive_networks
 
+
+def random_network(num_members, num_follows, seed, max_likes=None):
+    # Members 1..num_members joined by num_follows random follows (with a
+    # like of 0..max_likes along each when given). Draws from its own RNG,
+    # returned for further draws, so the global random state is untouched.
+    rng = random.Random(seed)
+    network = Network()
+    for i in range(1, num_members + 1):
+        network.add_member(i, f'Member{i}')
+    for _ in range(num_follows):
+        follower_id, followee_id = rng.sample(range(1, num_members + 1), 2)
+        network.follow(follower_id, followee_id)
+        if max_likes is not None:
+            network.like(follower_id, followee_id, rng.randint(0, max_likes))
+    return network, rng
+
+
 class TestSocialNetwork(unittest.TestCase):
 
     @classmethod
@@ -224,6 +241,962 @@ class TestSocialNetwork(unittest.TestCase):
         logging.info('test_network_summary.txt has been created.')
 
 
+class TestCSRNetwork(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.network = generate_progressive_networks([10])[0]
+        cls.network.ensure_required_path([1, 2, 3, 4, 5])
+        cls.graph = cls.network.freeze()
+
+    def test_adjacency_matches_members(self):
+        self.assertEqual(len(self.graph), len(self.network.members))
+        for member_id, member in self.network.members.items():
+            i = self.graph.index[member_id]
+            self.assertEqual(set(self.graph.path_ids(self.graph.following_of(i))), {m.member_id for m in member.following})
+            self.assertEqual(set(self.graph.path_ids(self.graph.followers_of(i))), {m.member_id for m in member.followers})
+            self.assertEqual(self.graph.engagement[i], member.total_engagement())
+        self.assertEqual(self.graph.edge_count, sum(len(m.following) for m in self.network.members.values()))
+
+    def test_algorithms_match_member_backend(self):
+        for start_id in self.network.members:
+            for end_id in self.network.members:
+                if start_id == end_id:
+                    continue
+                bfs_path = BFS.shortest_path(self.graph, start_id, end_id)
+                expected = BFS.shortest_path(self.network.members, start_id, end_id)
+                self.assertEqual(bfs_path is None, expected is None)
+                if bfs_path:
+                    self.assertEqual(len(bfs_path), len(expected))
+                    self.assertEqual((bfs_path[0], bfs_path[-1]), (start_id, end_id))
+
+                dijkstra_path = Dijkstra.traverse_members(self.graph, start_id, end_id)
+                self.assertEqual(len(dijkstra_path), len(bfs_path or []))
+
+                _, engagement = DFS.highest_engagement_path(self.graph, start_id, end_id)
+                _, expected_engagement = DFS.highest_engagement_path(self.network.members, start_id, end_id)
+                self.assertEqual(engagement, expected_engagement)
+
+
+class TestSingleSourceBFS(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.network = generate_progressive_networks([10])[0]
+        cls.network.add_member(11, 'Member11')
+        cls.graph = cls.network.freeze()
+
+    def test_tree_paths_match_pairwise_bfs(self):
+        for members in (self.network.members, self.graph):
+            trees = dict(BFS.all_shortest_paths(members))
+            self.assertEqual(set(trees), set(self.network.members))
+            for start_id, tree in trees.items():
+                self.assertEqual(tree.path_to(start_id), [start_id])
+                for end_id in self.network.members:
+                    if start_id == end_id:
+                        continue
+                    path = tree.path_to(end_id)
+                    expected = BFS.shortest_path(self.network.members, start_id, end_id)
+                    self.assertEqual(path is None, expected is None)
+                    if path:
+                        self.assertEqual(len(path), len(expected))
+                        self.assertEqual(tree.distance_to(end_id), len(path) - 1)
+                        for follower_id, followee_id in zip(path, path[1:]):
+                            self.assertIn(self.network.members[followee_id], self.network.members[follower_id].following)
+
+    def test_unreachable_member(self):
+        tree = BFS.shortest_paths_from(self.graph, 1)
+        self.assertNotIn(11, tree)
+        self.assertIsNone(tree.path_to(11))
+        self.assertEqual(tree.distance_to(11), float('inf'))
+
+
+class TestStatelessBFS(unittest.TestCase):
+
+    def test_concurrent_queries_match_sequential(self):
+        from concurrent.futures import ThreadPoolExecutor
+        network = generate_progressive_networks([10])[0]
+        pairs = [(a, b) for a in network.members for b in network.members if a != b]
+        expected = [BFS.shortest_path(network.members, a, b) for a, b in pairs]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda pair: BFS.shortest_path(network.members, *pair), pairs))
+        self.assertEqual([len(p) if p else None for p in results], [len(p) if p else None for p in expected])
+        self.assertFalse(any(hasattr(member, 'predecessor') for member in network.members.values()))
+
+    def test_stops_at_target(self):
+        network = Network()
+        for i in range(1, 8):
+            network.add_member(i, f'Member{i}')
+        network.ensure_required_path([1, 2, 3, 4, 5, 6, 7])
+        for members in (network.members, network.freeze()):
+            tree = BFS._search(members, 1, 3)
+            self.assertEqual(tree.path_to(3), [1, 2, 3])
+            self.assertNotIn(5, tree)
+            self.assertEqual(BFS.shortest_path(members, 1, 7), [1, 2, 3, 4, 5, 6, 7])
+            self.assertEqual(BFS.shortest_path(members, 2, 2), [2])
+            self.assertIsNone(BFS.shortest_path(members, 7, 1))
+
+
+class TestBidirectionalBFS(unittest.TestCase):
+
+    def test_matches_forward_bfs(self):
+        for network in generate_progressive_networks([10, 20]):
+            network.add_member(0, 'Isolated')
+            graph = network.freeze()
+            for start_id in network.members:
+                tree = BFS.shortest_paths_from(network.members, start_id)
+                for end_id in network.members:
+                    expected = tree.path_to(end_id)
+                    for members in (network.members, graph):
+                        path = BFS.bidirectional_shortest_path(members, start_id, end_id)
+                        self.assertEqual(path is None, expected is None)
+                        if path:
+                            self.assertEqual(len(path), len(expected))
+                            self.assertEqual((path[0], path[-1]), (start_id, end_id))
+                            for follower_id, followee_id in zip(path, path[1:]):
+                                self.assertIn(network.members[followee_id], network.members[follower_id].following)
+
+    def test_required_path(self):
+        network = Network()
+        for i in range(1, 6):
+            network.add_member(i, f'Member{i}')
+        network.ensure_required_path([1, 2, 3, 4, 5])
+        self.assertEqual(BFS.bidirectional_shortest_path(network.members, 1, 5), [1, 2, 3, 4, 5])
+        self.assertIsNone(BFS.bidirectional_shortest_path(network.members, 5, 1))
+
+
+class TestBoundedEngagementSearch(unittest.TestCase):
+
+    def test_matches_exhaustive_enumeration(self):
+        network = generate_progressive_networks([12])[0]
+        graph = network.freeze()
+        for max_depth in (0, 1, 3, 5):
+            for start_id in network.members:
+                for end_id in network.members:
+                    path, engagement = DFS.highest_engagement_path(network.members, start_id, end_id, max_depth=max_depth)
+                    _, expected = DFS.exhaustive_engagement_path(network.members, start_id, end_id, max_depth=max_depth)
+                    self.assertEqual(engagement, expected)
+                    self.assertEqual(DFS.highest_engagement_path(graph, start_id, end_id, max_depth=max_depth)[1], expected)
+                    if path:
+                        self.assertEqual((path[0], path[-1]), (start_id, end_id))
+                        self.assertLessEqual(len(path) - 1, max_depth)
+                        self.assertEqual(len(set(path)), len(path))
+                        self.assertEqual(sum(network.members[m].total_engagement() for m in path), engagement)
+
+
+class TestEngagementCounters(unittest.TestCase):
+
+    def test_counters_track_interactions(self):
+        from utils import find_inconsistent_counters
+        network = generate_progressive_networks([20])[0]
+        self.assertEqual(find_inconsistent_counters(network), [])
+        for member in network.members.values():
+            self.assertEqual(member.total_engagement(), sum(member.likes.values()) + sum(member.comments.values()))
+        self.assertEqual(sum(m.likes_given_total for m in network.members.values()),
+                         sum(m.likes_received_total for m in network.members.values()))
+
+        network.like(1, 2, 3)
+        network.comment(2, 1, 4)
+        self.assertEqual(find_inconsistent_counters(network), [])
+        network.members[1].likes[2] += 1
+        self.assertEqual(find_inconsistent_counters(network), [1])
+
+
+class TestReceivedEngagementIndex(unittest.TestCase):
+
+    def test_matches_full_scan(self):
+        network = generate_progressive_networks([15])[0]
+        for member_id in network.members:
+            likes_from = {m_id: m.likes[member_id] for m_id, m in network.members.items() if m.likes.get(member_id)}
+            comments_from = {m_id: m.comments[member_id] for m_id, m in network.members.items() if m.comments.get(member_id)}
+            self.assertEqual(network.likes_received(member_id), sum(likes_from.values()))
+            self.assertEqual(network.comments_received(member_id), sum(comments_from.values()))
+            self.assertEqual({k: v for k, v in network.likes_received_from(member_id).items() if v}, likes_from)
+            self.assertEqual({k: v for k, v in network.comments_received_from(member_id).items() if v}, comments_from)
+
+
+class TestInteractionMatrices(unittest.TestCase):
+
+    def test_matches_scalar_methods(self):
+        network = generate_progressive_networks([15])[0]
+        network.add_member(16, 'Member16')
+        matrices = network.to_interaction_matrices()
+        rates = matrices.engagement_rates()
+        influence = matrices.influence_matrix().toarray()
+        for member_id, member in network.members.items():
+            i = matrices.index[member_id]
+            self.assertAlmostEqual(rates[i], member.engagement_rate())
+            self.assertEqual(matrices.followers_count[i], len(member.followers))
+            for other_id, other in network.members.items():
+                self.assertAlmostEqual(influence[i, matrices.index[other_id]], member.influence_on(other))
+
+
+class TestTopKQueries(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        network = generate_progressive_networks([15])[0]
+        members = network.members
+        rates = sorted((m.engagement_rate() for m in members.values()), reverse=True)
+        self.assertEqual([rate for _, rate in network.top_influencers(5)], rates[:5])
+
+        all_edges = [(a, b, members[a].influence_on(members[b])) for a in members for b in members if a != b]
+        strongest = sorted((influence for _, _, influence in all_edges if influence > 0), reverse=True)
+        top_edges = network.strongest_influence_edges(10)
+        for (source_id, target_id, influence), expected in zip(top_edges, strongest):
+            self.assertAlmostEqual(influence, expected)
+            self.assertAlmostEqual(influence, members[source_id].influence_on(members[target_id]))
+        self.assertEqual(len(top_edges), min(10, len(strongest)))
+
+        for member_id in members:
+            expected = sorted((influence for a, _, influence in all_edges if a == member_id and influence > 0), reverse=True)
+            targets = network.top_influence_targets(member_id, 3)
+            self.assertEqual(len(targets), min(3, len(expected)))
+            for (_, influence), expected_influence in zip(targets, expected):
+                self.assertAlmostEqual(influence, expected_influence)
+
+
+class TestQuietReport(unittest.TestCase):
+
+    def test_quiet_mode_skips_tracing_but_not_report(self):
+        import contextlib
+        import io
+        from report import network_sections
+        from utils import set_tracing
+        network = generate_progressive_networks([8])[0]
+        traced_output, quiet_output = io.StringIO(), io.StringIO()
+        try:
+            with contextlib.redirect_stdout(traced_output):
+                traced_report = ''.join(network_sections(network, 8))
+            set_tracing(False)
+            with contextlib.redirect_stdout(quiet_output):
+                quiet_report = ''.join(network_sections(network, 8))
+        finally:
+            set_tracing(True)
+        self.assertEqual(traced_report, quiet_report)
+        self.assertIn("Visiting member", traced_output.getvalue())
+        self.assertEqual(quiet_output.getvalue(), "")
+        self.assertEqual(quiet_report.count("\nMember "), 8)
+
+
+class TestParallelReport(unittest.TestCase):
+
+    def test_matches_serial_report(self):
+        from report import network_sections
+        from utils import set_tracing
+        network = generate_progressive_networks([12])[0]
+        set_tracing(False)
+        try:
+            serial = list(network_sections(network, 12))
+            parallel = list(network_sections(network, 12, workers=2))
+        finally:
+            set_tracing(True)
+        self.assertEqual(serial, parallel)
+
+
+class TestGraphFile(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'network.graph')
+        self.network = generate_progressive_networks([15])[0]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        import pickle
+        from data_structures.graph_file import SECTIONS, load_graph, load_network, save_network
+        save_network(self.network, self.path)
+        frozen = self.network.freeze()
+        graph = load_graph(self.path)
+        self.assertEqual(list(graph.member_ids), frozen.member_ids)
+        self.assertEqual(list(graph.names), frozen.names)
+        for section in SECTIONS[3:]:
+            self.assertEqual(list(getattr(graph, section)), list(getattr(frozen, section)), section)
+        self.assertEqual(BFS.shortest_path(graph, 1, 5), BFS.shortest_path(frozen, 1, 5))
+        self.assertEqual(pickle.loads(pickle.dumps(graph)).source_path, graph.source_path)
+
+        loaded = load_network(self.path)
+        for member_id, member in self.network.members.items():
+            other = loaded.members[member_id]
+            self.assertEqual(other.name, member.name)
+            self.assertEqual({m.member_id for m in other.following}, {m.member_id for m in member.following})
+            self.assertEqual(dict(other.likes), dict(member.likes))
+            self.assertEqual(dict(other.comments_to), dict(member.comments_to))
+            self.assertEqual(other.total_engagement(), member.total_engagement())
+
+    def test_rejects_other_files(self):
+        from data_structures.graph_file import load_graph, save_network
+        self.network.add_member('x', 'Named')
+        with self.assertRaises(ValueError):
+            save_network(self.network, self.path)
+        with open(self.path, 'wb') as f:
+            f.write(b'not a graph file at all')
+        with self.assertRaises(ValueError):
+            load_graph(self.path)
+
+    def test_rejects_corrupt_files(self):
+        from data_structures.graph_file import load_graph, save_network
+        save_network(self.network, self.path)
+        with open(self.path, 'rb') as f:
+            contents = f.read()
+        for corrupt in (b'', contents[:5], contents[:20], contents[:len(contents) // 2], contents[:-3]):
+            with open(self.path, 'wb') as f:
+                f.write(corrupt)
+            with self.assertRaises(ValueError):
+                load_graph(self.path)
+
+    def test_report_from_graph_file(self):
+        from report import network_sections
+        from utils import set_tracing
+        from data_structures.graph_file import load_graph, save_network
+        save_network(self.network, self.path)
+        set_tracing(False)
+        try:
+            from_network = ''.join(network_sections(self.network, 15))
+            from_graph = ''.join(network_sections(None, 15, graph=load_graph(self.path)))
+        finally:
+            set_tracing(True)
+        self.assertEqual(from_graph, from_network)
+
+
+class TestEventIngestion(unittest.TestCase):
+
+    def test_ingest_event_logs(self):
+        import tempfile
+        from data_structures.event_log import read_events, write_events
+        events = [('follow', 1, 2, 1), ('follow', 2, 3, 1), ('like', 1, 2, 4), ('comment', 3, 1, 2),
+                  ('like', 1, 2, 1), ('follow', 3, 'alice', 1)]
+        with tempfile.TemporaryDirectory() as directory:
+            for fmt in ('csv', 'jsonl'):
+                path = os.path.join(directory, f'events.{fmt}')
+                write_events(events, path)
+                self.assertEqual(list(read_events(path)), events)
+
+                network = Network()
+                network.add_member(1, 'Existing')
+                self.assertEqual(network.ingest(read_events(path)), len(events))
+                self.assertEqual(set(network.members), {1, 2, 3, 'alice'})
+                self.assertEqual(network.members[1].name, 'Existing')
+                self.assertEqual(BFS.shortest_path(network.members, 1, 'alice'), [1, 2, 3, 'alice'])
+                self.assertEqual(network.members[1].likes[2], 5)
+                self.assertEqual(network.likes_received(2), 5)
+                self.assertEqual(network.comments_received(1), 2)
+
+    def test_rejects_unknown_events(self):
+        network = Network()
+        events = []
+        network.add_listener(lambda *event: events.append(event))
+        with self.assertRaises(ValueError):
+            network.ingest([('follow', 1, 2, 1), ('poke', 3, 4, 1)])
+        # Events before the rejected one stay applied; its members are never created
+        self.assertEqual(set(network.members), {1, 2})
+        self.assertEqual(events, [('add_member', 1, None), ('add_member', 2, None), ('follow', 1, 2)])
+
+
+class TestGraphGenerators(unittest.TestCase):
+
+    def test_generated_graphs_are_consistent(self):
+        import graph_generators
+        for generate in (graph_generators.erdos_renyi, graph_generators.power_law, graph_generators.community):
+            graph = generate(300, 5, seed=7)
+            again = generate(300, 5, seed=7)
+            self.assertEqual(graph.following_indices, again.following_indices)
+            self.assertEqual(graph.likes_counts, again.likes_counts)
+
+            edges = set()
+            for i in range(len(graph)):
+                following = list(graph.following_of(i))
+                self.assertEqual(len(following), len(set(following)))
+                self.assertNotIn(i, following)
+                edges.update((i, j) for j in following)
+                for j, _ in graph.likes_of(i):
+                    self.assertIn((i, j), edges)
+                self.assertEqual(graph.engagement[i], sum(c for _, c in graph.likes_of(i)) + sum(c for _, c in graph.comments_of(i)))
+            self.assertEqual(edges, {(i, j) for j in range(len(graph)) for i in graph.followers_of(j)})
+
+            network = Network.from_graph(graph)
+            self.assertEqual(network.freeze().following_indices, graph.following_indices)
+            for i, member_id in enumerate(graph.member_ids):
+                self.assertEqual(network.members[member_id].total_engagement(), graph.engagement[i])
+                self.assertEqual(network.members[member_id].name, graph.names[i])
+
+
+class TestTraversalInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.network = Network()
+        for i in range(1, 6):
+            self.network.add_member(i, f'Member{i}')
+        for follower_id, followee_id in ((1, 2), (2, 3), (3, 4), (1, 3), (4, 5)):
+            self.network.follow(follower_id, followee_id)
+        self.network.like(2, 1, 3)
+
+    def test_counters_match_on_both_backends(self):
+        from instrumentation import StatsCollector
+        for graph in (self.network.members, self.network.freeze()):
+            stats = StatsCollector(keep_queries=True)
+            self.assertEqual(BFS.shortest_path(graph, 1, 5, stats=stats), [1, 3, 4, 5])
+            Dijkstra.traverse_members(graph, 1, 5, stats=stats)
+            DFS.highest_engagement_path(graph, 1, 5, stats=stats)
+            BFS.bidirectional_shortest_path(graph, 1, 5, stats=stats)
+
+            bfs, dijkstra, dfs, bidirectional = stats.history
+            self.assertEqual((bfs.nodes_visited, bfs.edges_relaxed), (5, 5))
+            self.assertEqual((dijkstra.nodes_visited, dijkstra.edges_relaxed), (5, 5))
+            self.assertEqual(dijkstra.heap_pushes, dijkstra.heap_pops)
+            self.assertGreater(dfs.nodes_visited, 0)
+            self.assertGreater(bidirectional.nodes_visited, 0)
+
+            summary = stats.summary()
+            self.assertEqual(summary['bfs']['queries'], 1)
+            self.assertGreaterEqual(summary['dijkstra']['elapsed']['total'], 0)
+
+            # The target's own out-edges (4 -> 5) are never relaxed
+            stats = StatsCollector(keep_queries=True)
+            BFS.shortest_path(graph, 1, 4, stats=stats)
+            Dijkstra.traverse_members(graph, 1, 4, stats=stats)
+            for query in stats.history:
+                self.assertEqual((query.nodes_visited, query.edges_relaxed), (4, 4), query.algorithm)
+
+    def test_collector_aggregates_queries(self):
+        from instrumentation import StatsCollector
+        stats = StatsCollector()
+        for start_id in range(1, 6):
+            BFS.shortest_paths_from(self.network.members, start_id, stats=stats)
+        summary = stats.summary()['bfs']
+        self.assertEqual(summary['queries'], 5)
+        self.assertEqual(summary['nodes_visited']['total'], 5 + 4 + 3 + 2 + 1)
+        self.assertEqual(summary['nodes_visited']['max'], 5)
+        self.assertIn('bfs', stats.format_summary())
+
+
+class TestPathQueryService(unittest.TestCase):
+
+    def test_cached_answers_match_fresh_queries_under_mutation(self):
+        from query_service import PathQueryService
+        network, rng = random_network(30, 40, seed=11)
+        service = PathQueryService(network, maxsize=50)
+
+        for _ in range(200):
+            start_id, end_id = rng.randint(1, 30), rng.randint(1, 30)
+            # Ties between equally good paths may be broken differently, so
+            # compare lengths / engagement and check the cached path is valid
+            path = service.shortest_path(start_id, end_id)
+            expected = BFS.shortest_paths_from(network.members, start_id).path_to(end_id)
+            self.assertEqual(path is None, expected is None)
+            if path is not None:
+                self.assertEqual(len(path), len(expected))
+                for follower_id, followee_id in zip(path, path[1:]):
+                    self.assertIn(network.members[followee_id], network.members[follower_id].following)
+            self.assertEqual(service.highest_engagement_path(start_id, end_id, max_depth=3)[1],
+                             DFS.highest_engagement_path(network.members, start_id, end_id, max_depth=3)[1])
+
+            source_id, target_id = rng.sample(range(1, 31), 2)
+            mutation = rng.choice((network.follow, network.unfollow, network.like, network.comment))
+            if mutation == network.unfollow:
+                following = sorted(m.member_id for m in network.members[source_id].following)
+                if following:
+                    mutation(source_id, rng.choice(following))
+            elif mutation == network.follow:
+                mutation(source_id, target_id)
+            else:
+                mutation(source_id, target_id, rng.randint(1, 5))
+
+        info = service.cache_info()
+        self.assertGreater(info['trees']['hits'], 0)
+        self.assertGreater(info['trees']['updates'], 0)
+        self.assertEqual(info['version'], network.version)
+
+    def test_invalidation_is_limited_to_affected_sources(self):
+        from query_service import PathQueryService
+        network = Network()
+        for i in range(1, 7):
+            network.add_member(i, f'Member{i}')
+        network.ensure_required_path([1, 2, 3])
+        network.ensure_required_path([4, 5, 6])
+        service = PathQueryService(network)
+        service.shortest_path(1, 3)
+        service.shortest_path(4, 6)
+
+        network.follow(2, 1)  # back edge, no distance from 1 changes
+        network.follow(5, 1)  # reaches new members from 4 only
+        network.like(3, 2, 1)  # likes don't change hop distances
+        info = service.cache_info()['trees']
+        self.assertEqual((info['updates'], info['invalidations']), (1, 0))
+        self.assertEqual(service.shortest_path(4, 3), [4, 5, 1, 2, 3])
+        self.assertEqual(service.cache_info()['trees']['hits'], 1)
+
+        service.close()
+        self.assertEqual(network.listeners, [])
+
+
+class TestIncrementalBFS(unittest.TestCase):
+
+    def test_inserted_edges_match_full_recompute(self):
+        from algorithms.incremental_bfs import IncrementalBFS
+        network, rng = random_network(60, 40, seed=5)
+        trees = {start_id: BFS.shortest_paths_from(network.members, start_id) for start_id in (1, 2, 3)}
+
+        for _ in range(150):
+            follower_id, followee_id = rng.sample(range(1, 61), 2)
+            network.follow(follower_id, followee_id)
+            for start_id, tree in trees.items():
+                IncrementalBFS.insert_edge(network.members, tree, follower_id, followee_id)
+                self.assertEqual(tree.distances, BFS.shortest_paths_from(network.members, start_id).distances)
+                for member_id in tree.distances:
+                    self.assertEqual(len(tree.path_to(member_id)) - 1, tree.distances[member_id])
+
+    def test_deleting_a_tree_edge_repairs_the_subtree(self):
+        from algorithms.incremental_bfs import IncrementalBFS
+        network = Network()
+        for i in range(1, 6):
+            network.add_member(i, f'Member{i}')
+        network.ensure_required_path([1, 2, 3, 4])
+        network.follow(1, 3)
+        tree = BFS.shortest_paths_from(network.members, 1)
+
+        self.assertEqual(IncrementalBFS.delete_edge(network.members, tree, 2, 3), 0)
+        network.unfollow(1, 3)
+        self.assertEqual(IncrementalBFS.delete_edge(network.members, tree, 1, 3), 2)
+        self.assertEqual(tree.path_to(4), [1, 2, 3, 4])
+        network.unfollow(1, 2)
+        self.assertEqual(IncrementalBFS.delete_edge(network.members, tree, 1, 2), 3)
+        self.assertEqual(tree.distances, {1: 0})
+
+    def test_deleted_edges_match_full_recompute(self):
+        from algorithms.incremental_bfs import IncrementalBFS
+        network, rng = random_network(40, 160, seed=9)
+        trees = {start_id: BFS.shortest_paths_from(network.members, start_id) for start_id in (1, 2, 3)}
+
+        for _ in range(120):
+            follower = network.members[rng.randint(1, 40)]
+            if not follower.following:
+                continue
+            followee = rng.choice(sorted(follower.following, key=lambda m: m.member_id))
+            network.unfollow(follower.member_id, followee.member_id)
+            for start_id, tree in trees.items():
+                IncrementalBFS.delete_edge(network.members, tree, follower.member_id, followee.member_id)
+                self.assertEqual(tree.distances, BFS.shortest_paths_from(network.members, start_id).distances)
+                for member_id in tree.distances:
+                    path = tree.path_to(member_id)
+                    self.assertEqual(len(path) - 1, tree.distances[member_id])
+                    for a, b in zip(path, path[1:]):
+                        self.assertIn(network.members[b], network.members[a].following)
+
+
+class TestRemovalOperations(unittest.TestCase):
+
+    def setUp(self):
+        self.network = Network()
+        for i in range(1, 5):
+            self.network.add_member(i, f'Member{i}')
+        self.network.ensure_required_path([1, 2, 3, 4])
+        self.network.follow(1, 3)
+        self.network.like(1, 2, 5)
+        self.network.comment(1, 2, 2)
+        self.network.like(3, 2, 1)
+
+    def test_unfollow_updates_both_sides(self):
+        members = self.network.members
+        self.network.unfollow(1, 3)
+        self.assertNotIn(members[3], members[1].following)
+        self.assertNotIn(members[1], members[3].followers)
+        self.network.unfollow(1, 3)  # removing a missing edge is a no-op
+        self.assertEqual(BFS.shortest_path(members, 1, 4), [1, 2, 3, 4])
+
+    def test_retractions_keep_maps_and_totals_consistent(self):
+        from utils import find_inconsistent_counters
+        members = self.network.members
+        self.assertEqual(self.network.unlike(1, 2, 3), 3)
+        self.assertEqual((members[1].likes[2], members[2].likes_to[1]), (2, 2))
+        self.assertEqual(self.network.unlike(1, 2, 10), 2)
+        self.assertNotIn(2, members[1].likes)
+        self.assertNotIn(1, members[2].likes_to)
+        self.assertEqual(self.network.unlike(1, 2), 0)
+        self.assertEqual(self.network.uncomment(1, 2), 2)
+
+        self.assertEqual(members[1].total_engagement(), 0)
+        self.assertEqual(self.network.likes_received(2), 1)
+        self.assertEqual(self.network.comments_received_from(2), {})
+        self.assertEqual(find_inconsistent_counters(self.network), [])
+
+    def test_removals_notify_listeners_and_ingest(self):
+        from query_service import PathQueryService
+        service = PathQueryService(self.network)
+        self.assertEqual(service.shortest_path(1, 4), [1, 3, 4])
+        version = self.network.version
+
+        applied = self.network.ingest([('unfollow', 1, 3, 1), ('unlike', 3, 2, 1), ('follow', 4, 1, 1)])
+        self.assertEqual(applied, 3)
+        self.assertEqual(self.network.version, version + 3)
+        self.assertEqual(service.shortest_path(1, 4), [1, 2, 3, 4])
+        self.assertEqual(self.network.likes_received_from(2), {1: 5})
+        with self.assertRaises(ValueError):
+            self.network.ingest([('block', 1, 2, 1)])
+
+    def test_noop_retractions_are_not_changes(self):
+        events = []
+        self.network.add_listener(lambda *event: events.append(event))
+        version = self.network.version
+        self.assertFalse(self.network.unfollow(2, 1))
+        self.assertEqual(self.network.unlike(2, 1), 0)
+        self.assertEqual(self.network.uncomment(3, 4, 2), 0)
+        self.assertEqual((self.network.version, events), (version, []))
+        self.assertTrue(self.network.unfollow(1, 3))
+        self.assertEqual(events, [('unfollow', 1, 3)])
+
+
+class TestWeightedDijkstra(unittest.TestCase):
+
+    def setUp(self):
+        # 1 -> 2 -> 4 is the shortest route, 1 -> 3 -> 5 -> 4 the most engaged
+        self.network = Network()
+        for i in range(1, 7):
+            self.network.add_member(i, f'Member{i}')
+        self.network.ensure_required_path([1, 2, 4])
+        self.network.ensure_required_path([1, 3, 5, 4])
+        for liker_id, likee_id in ((1, 3), (3, 5), (5, 4)):
+            self.network.like(liker_id, likee_id, 10)
+        self.network.comment(1, 2, 1)
+        self.network.like(4, 1, 5)
+
+    def test_engagement_weights_prefer_strong_routes(self):
+        for graph in (self.network.members, self.network.freeze()):
+            self.assertEqual(Dijkstra.traverse_members(graph, 1, 4), [1, 2, 4])
+            weight = Dijkstra.inverse_engagement_weight(graph)
+            self.assertEqual(Dijkstra.traverse_members(graph, 1, 4, weight=weight), [1, 3, 5, 4])
+            self.assertEqual(Dijkstra.traverse_members(graph, 1, 6, weight=weight), [])
+
+    def test_influence_weights_match_influence_on(self):
+        members = self.network.members
+        for graph in (members, self.network.freeze()):
+            weight = Dijkstra.inverse_influence_weight(graph)
+            for from_id, to_id in ((1, 4), (4, 1), (2, 4)):
+                influence = members[from_id].influence_on(members[to_id])
+                self.assertAlmostEqual(weight(from_id, to_id), 1 / (1 + influence))
+
+    def test_rejects_non_positive_weights(self):
+        for graph in (self.network.members, self.network.freeze()):
+            for cost in (0, -1):
+                with self.assertRaises(ValueError):
+                    Dijkstra.traverse_members(graph, 1, 4, weight=lambda from_id, to_id: cost)
+
+    def test_matches_exhaustive_distances(self):
+        network, _ = random_network(40, 200, seed=3, max_likes=5)
+        weight = Dijkstra.inverse_engagement_weight(network.members)
+
+        # Bellman-Ford relaxation as the reference
+        distances = {1: 0}
+        for _ in range(40):
+            for member in network.members.values():
+                if member.member_id in distances:
+                    for followee in member.following:
+                        distance = distances[member.member_id] + weight(member.member_id, followee.member_id)
+                        if distance < distances.get(followee.member_id, float('inf')):
+                            distances[followee.member_id] = distance
+        for end_id in range(2, 41):
+            path = Dijkstra.traverse_members(network.members, 1, end_id, weight=weight)
+            if end_id not in distances:
+                self.assertEqual(path, [])
+                continue
+            cost = sum(weight(a, b) for a, b in zip(path, path[1:]))
+            self.assertAlmostEqual(cost, distances[end_id])
+
+    def test_indexed_heap_decrease_key(self):
+        from data_structures.indexed_heap import IndexedHeap
+        heap = IndexedHeap()
+        rng = random.Random(13)
+        priorities = {key: rng.random() for key in range(100)}
+        for key, priority in priorities.items():
+            heap.push(key, priority)
+        for key in range(0, 100, 3):
+            self.assertTrue(heap.push(key, priorities[key] / 2))
+            priorities[key] /= 2
+        self.assertFalse(heap.push(1, 2.0))
+        self.assertEqual(len(heap), 100)
+        popped = [heap.pop() for _ in range(100)]
+        self.assertEqual(popped, sorted(priorities.items(), key=lambda item: item[1]))
+
+
+class TestCompactMember(unittest.TestCase):
+
+    def test_maps_are_shared_until_first_write(self):
+        from data_structures.member import Member, EMPTY_COUNTS, EMPTY_MEMBERS
+        a, b = Member(1, 'A'), Member(2, 'B')
+        self.assertFalse(hasattr(a, '__dict__'))
+        self.assertIs(a.likes, EMPTY_COUNTS)
+        self.assertIs(b.followers, EMPTY_MEMBERS)
+        with self.assertRaises(TypeError):
+            a.likes[2] = 1
+        with self.assertRaises(TypeError):
+            a.likes |= {2: 1}
+        self.assertEqual(dict(EMPTY_COUNTS), {})
+
+        a.like(b, 2)
+        a.follow(b)
+        self.assertEqual((a.likes, b.likes_to), ({2: 2}, {1: 2}))
+        self.assertIs(a.likes_to, EMPTY_COUNTS)
+        self.assertIs(b.following, EMPTY_MEMBERS)
+        self.assertEqual(b.followers, {a})
+
+    def test_reads_never_insert(self):
+        from data_structures.member import Member
+        a, b, c = Member(1, 'A'), Member(2, 'B'), Member(3, 'C')
+        b.like(a, 3)
+        a.comment(c, 1)
+        self.assertEqual(a.influence_on(c), 0.0)
+        self.assertEqual(c.influence_on(a), 0.0)
+        self.assertEqual(a.likes_to[3], 0)
+        self.assertEqual(c.comments[1], 0)
+        self.assertEqual(dict(a.likes_to), {2: 3})
+        self.assertEqual(dict(c.comments), {})
+
+    def test_pickling_keeps_shared_instances(self):
+        import pickle
+        from data_structures.member import EMPTY_COUNTS, EMPTY_MEMBERS
+        network = Network()
+        for i in range(1, 4):
+            network.add_member(i, f'Member{i}')
+        network.follow(1, 2)
+        network.like(2, 3, 4)
+        members = pickle.loads(pickle.dumps(network.members))
+        self.assertIs(members[3].following, EMPTY_MEMBERS)
+        self.assertIs(members[1].likes, EMPTY_COUNTS)
+        self.assertEqual(members[3].likes_to, {2: 4})
+        self.assertEqual([m.member_id for m in members[1].following], [2])
+
+
+class TestReachability(unittest.TestCase):
+
+    def setUp(self):
+        self.network, _ = random_network(50, 70, seed=17)
+        self.trees = {member_id: BFS.shortest_paths_from(self.network.members, member_id)
+                      for member_id in self.network.members}
+
+    def within(self, member_id, hops):
+        return {other_id for other_id, distance in self.trees[member_id].distances.items() if distance <= hops}
+
+    def test_k_hop_neighbourhood_and_multi_source_reach(self):
+        from algorithms.reachability import Reachability
+        graph = self.network.freeze()
+        for member_id in (1, 7, 23):
+            for k in (0, 1, 3):
+                self.assertEqual(Reachability.k_hop_neighbourhood(graph, member_id, k), self.within(member_id, k) - {member_id})
+        seeds = [2, 9, 40]
+        self.assertEqual(Reachability.multi_source_reach(self.network.members, seeds),
+                         set().union(*(self.trees[seed].distances for seed in seeds)))
+        self.assertEqual(Reachability.multi_source_reach(graph, seeds, max_hops=2),
+                         set().union(*(self.within(seed, 2) for seed in seeds)))
+
+    def test_reach_counts_match_per_member_bfs(self):
+        from algorithms.reachability import Reachability
+        graph = self.network.freeze()
+        # A small batch size exercises several target batches
+        self.assertEqual(Reachability.reach_counts(graph, batch_size=7),
+                         {member_id: len(tree.distances) - 1 for member_id, tree in self.trees.items()})
+        self.assertEqual(Reachability.reach_counts(graph, max_hops=2),
+                         {member_id: len(self.within(member_id, 2)) - 1 for member_id in self.trees})
+
+
+class TestStronglyConnectedComponents(unittest.TestCase):
+
+    def setUp(self):
+        self.network, _ = random_network(60, 80, seed=29)
+        self.reach = {member_id: set(BFS.shortest_paths_from(self.network.members, member_id).distances)
+                      for member_id in self.network.members}
+
+    def test_components_match_mutual_reachability(self):
+        from algorithms.scc import SCC
+        components = SCC.components(self.network.members)
+        self.assertEqual(sorted(m for component in components for m in component), list(range(1, 61)))
+        for c, component in enumerate(components):
+            for member_id in component:
+                self.assertEqual(set(component), {other_id for other_id in self.reach[member_id] if member_id in self.reach[other_id]})
+                # Edges leaving a component go to components found earlier
+                for followee in self.network.members[member_id].following:
+                    self.assertLessEqual(next(i for i, other in enumerate(components) if followee.member_id in other), c)
+
+    def test_reachability_index_matches_bfs(self):
+        from algorithms.scc import ReachabilityIndex
+        graph = self.network.freeze()
+        for index in (ReachabilityIndex(graph), ReachabilityIndex(graph, max_closure_components=0)):
+            for start_id in self.network.members:
+                for end_id in self.network.members:
+                    self.assertEqual(index.reachable(start_id, end_id), end_id in self.reach[start_id])
+
+    def test_long_chain_without_recursion(self):
+        from algorithms.scc import SCC
+        network = Network()
+        for i in range(20000):
+            network.add_member(i, f'Member{i}')
+        network.ensure_required_path(list(range(20000)))
+        network.follow(19999, 10000)
+        components = SCC.components(network.members)
+        self.assertEqual(len(components), 10001)
+        self.assertEqual(len(components[0]), 10000)
+        self.assertTrue(network.reachable(0, 19999))
+        self.assertFalse(network.reachable(10000, 9999))
+
+    def test_network_index_is_rebuilt_after_changes(self):
+        index = self.network.reachability_index()
+        self.assertIs(self.network.reachability_index(), index)
+        # Interactions leave the follow graph, and so the index, unchanged
+        self.network.like(1, 2, 3)
+        self.network.comment(2, 1, 1)
+        self.network.unlike(1, 2)
+        self.assertIs(self.network.reachability_index(), index)
+        start_id, end_id = next((a, b) for a in self.reach for b in self.reach if b not in self.reach[a])
+        self.assertFalse(self.network.reachable(start_id, end_id))
+        self.network.follow(start_id, end_id)
+        self.assertTrue(self.network.reachable(start_id, end_id))
+        self.assertIsNot(self.network.reachability_index(), index)
+
+    def test_report_skips_only_unreachable_pairs(self):
+        from algorithms.scc import ReachabilityIndex
+        from report import member_paths
+        from utils import set_tracing
+        graph = self.network.freeze()
+        index = ReachabilityIndex(graph)
+        set_tracing(False)
+        try:
+            for member_id in (1, 2, 3):
+                self.assertEqual(member_paths(graph, member_id, reachability=index), member_paths(graph, member_id))
+        finally:
+            set_tracing(True)
+
+
+class TestLandmarkOracle(unittest.TestCase):
+
+    def setUp(self):
+        self.network, _ = random_network(80, 200, seed=31)
+        self.graph = self.network.freeze()
+
+    def test_bounds_contain_exact_distance(self):
+        from algorithms.landmarks import LandmarkOracle
+        oracle = LandmarkOracle.build(self.graph, num_landmarks=4)
+        exact_upper = 0
+        for start_id in self.network.members:
+            tree = BFS.shortest_paths_from(self.graph, start_id)
+            for end_id in self.network.members:
+                lower, upper = oracle.bounds(start_id, end_id)
+                distance = tree.distance_to(end_id)
+                self.assertLessEqual(lower, distance)
+                self.assertGreaterEqual(upper, distance)
+                exact_upper += upper == distance
+        # Landmarks on busy members give the exact distance for many pairs
+        self.assertGreater(exact_upper, 80 * 80 // 4)
+
+    def test_save_and_load(self):
+        import tempfile
+        from array import array
+        from algorithms.landmarks import LandmarkOracle
+        from data_structures.graph_file import save_landmarks, load_landmarks
+        oracle = LandmarkOracle.build(self.graph, num_landmarks=3)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'network.landmarks')
+            save_landmarks(oracle, path)
+            loaded = load_landmarks(path, self.graph)
+            for start_id, end_id in ((1, 2), (5, 70), (33, 33), (80, 1)):
+                self.assertEqual(loaded.bounds(start_id, end_id), oracle.bounds(start_id, end_id))
+            small = Network()
+            small.add_member(1, 'Member1')
+            with self.assertRaises(ValueError):
+                load_landmarks(path, small.freeze())
+
+            # A truncated backward table or an out-of-range landmark
+            k = len(oracle.landmarks)
+            for corrupt in (LandmarkOracle(self.graph, oracle.landmarks, oracle.forward, oracle.backward[:-k]),
+                            LandmarkOracle(self.graph, oracle.landmarks[:-1] + array('q', [len(self.graph)]),
+                                           oracle.forward, oracle.backward)):
+                save_landmarks(corrupt, path)
+                with self.assertRaises(ValueError):
+                    load_landmarks(path, self.graph)
+
+
+class TestInfluenceRank(unittest.TestCase):
+
+    def setUp(self):
+        self.network, _ = random_network(40, 120, seed=37, max_likes=4)
+        self.network.like(3, 39, 7)  # not a follow edge, so it carries no rank
+
+    def reference_scores(self, damping=0.85, seeds=None):
+        # Plain-Python power iteration over the Members
+        members = self.network.members
+        teleport = {m: (1.0 if seeds is None or m in seeds else 0.0) for m in members}
+        total = sum(teleport.values())
+        teleport = {m: value / total for m, value in teleport.items()}
+        scores = dict(teleport)
+        for _ in range(200):
+            updated = {m: (1 - damping) * teleport[m] for m in members}
+            dangling = 0.0
+            for member_id, member in members.items():
+                weights = {f.member_id: 1 + member.likes[f.member_id] + member.comments[f.member_id] for f in member.following}
+                if not weights:
+                    dangling += scores[member_id]
+                    continue
+                out_weight = sum(weights.values())
+                for followee_id, weight in weights.items():
+                    updated[followee_id] += damping * scores[member_id] * weight / out_weight
+            for m in members:
+                updated[m] += damping * dangling * teleport[m]
+            scores = updated
+        return scores
+
+    def test_scores_match_reference(self):
+        result = self.network.influence_ranking(tol=1e-12)
+        self.assertTrue(result.converged)
+        self.assertAlmostEqual(result.scores.sum(), 1.0)
+        for member_id, score in self.reference_scores().items():
+            self.assertAlmostEqual(result[member_id], score, places=9)
+
+        personalised = self.network.influence_ranking(seeds=[1, 2], tol=1e-12)
+        for member_id, score in self.reference_scores(seeds={1, 2}).items():
+            self.assertAlmostEqual(personalised[member_id], score, places=9)
+        reached = set(BFS.shortest_paths_from(self.network.members, 1).distances) | set(BFS.shortest_paths_from(self.network.members, 2).distances)
+        for member_id in set(self.network.members) - reached:
+            self.assertEqual(personalised[member_id], 0.0)
+
+    def test_warm_start_after_changes(self):
+        from algorithms.pagerank import PageRank
+        before = self.network.influence_ranking(tol=1e-10)
+        self.network.follow(5, 6)
+        self.network.add_member(41, 'Member41')
+        self.network.follow(41, 5)
+        matrices = self.network.to_interaction_matrices()
+        cold = PageRank.influence_scores(matrices, tol=1e-10)
+        warm = PageRank.influence_scores(matrices, tol=1e-10, warm_start=before)
+        self.assertLess(warm.iterations, cold.iterations)
+        self.assertLess(abs(warm.scores - cold.scores).sum(), 1e-8)
+        self.assertEqual([member_id for member_id, _ in warm.top(3)], [member_id for member_id, _ in cold.top(3)])
+
+    def test_rejects_bad_input(self):
+        import numpy as np
+        from algorithms.pagerank import PageRank
+        for seeds in ({1: 0}, [], {1: 1, 2: -1}, [1, 99]):
+            with self.assertRaises(ValueError):
+                self.network.influence_ranking(seeds=seeds)
+        with self.assertRaises(ValueError):
+            Network().influence_ranking()
+
+        matrices = self.network.to_interaction_matrices()
+        cold = PageRank.influence_scores(matrices)
+        for warm_start in (dict.fromkeys(self.network.members, 0.0), {}):
+            warm = PageRank.influence_scores(matrices, warm_start=warm_start)
+            self.assertFalse(np.isnan(warm.scores).any())
+            self.assertEqual(warm.iterations, cold.iterations)
+
+    def test_matrices_from_graph_match_members(self):
+        from data_structures.interaction_matrices import InteractionMatrices
+        from_members = self.network.to_interaction_matrices()
+        from_graph = InteractionMatrices.from_graph(self.network.freeze())
+        self.assertEqual(from_graph.member_ids, from_members.member_ids)
+        for attribute in ('following', 'likes', 'comments'):
+            self.assertEqual((getattr(from_graph, attribute) != getattr(from_members, attribute)).nnz, 0)
+        self.assertEqual(list(from_graph.followers_count), list(from_members.followers_count))
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -40,15 +40,18 @@ def generate_progressive_networks(sizes):
         print(f"Generated like and comment interactions for network of size {size}: {like_comment_interactions}")
 
         for member_id, member in net.members.items():
-            total_likes_given = sum(member.likes.values())
-            total_likes_received = sum(m.likes.get(member_id, 0) for m in net.members.values())
-            total_comments_given = sum(member.comments.values())
-            total_comments_received = sum(m.comments.get(member_id, 0) for m in net.members.values())
+            total_likes_given = member.likes_given_total
+            total_likes_received = net.likes_received(member_id)
+            total_comments_given = member.comments_given_total
+            total_comments_received = net.comments_received(member_id)
             engagement_rate = (total_likes_given + total_comments_given) / len(member.followers) * 100 if member.followers else 0
             member.engagement_rate_value = engagement_rate
         networks.append(net)
     return networks
 
+def find_inconsistent_counters(network):
+    return [member_id for member_id, member in network.members.items() if not member.counters_consistent()]
+
 def calculate_influence(network):
     for member in network.members.values():
         influences = {}
@@ -65,6 +68,17 @@ TERMCOLOR_COLORS = ['red', 'green', 'yellow', 'blue', 'magenta', 'cyan']
 def random_color():
     return random.choice(TERMCOLOR_COLORS)
 
+# Per-step traversal tracing. Algorithms read this once per call and skip
+# building their trace messages entirely when it is off.
+TRACE_ENABLED = True
+
+def set_tracing(enabled):
+    global TRACE_ENABLED
+    TRACE_ENABLED = enabled
+
+def tracing_enabled():
+    return TRACE_ENABLED
+
 def log_and_print(message, color=None, file=None):
     if color:
         colored_message = colored(message, color)